@@ -1,23 +1,31 @@
 import sys
 import os
+import atexit
+import bisect
+import concurrent.futures
+import functools
+import queue
 import tkinter as tk
-from tkinter import messagebox, filedialog
+from tkinter import messagebox
 import ttkbootstrap as b
 from ttkbootstrap.constants import *
 import database_manager as dbm
-import table_ui # Import the new UI module
-from ui_theme import AppTheme # Import the new theme class
-from custom_widgets import CustomButton # Import our new custom button
+from ui_theme import THEME # The shared UI theme instance
+from custom_widgets import CustomButton, VirtualListbox # Import our custom widgets
 
+# One shared pool for background I/O, reused for the lifetime of the app
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="dbm-io")
+atexit.register(_EXECUTOR.shutdown, wait=False)
+# How often the Tk thread checks for finished background jobs while any are running
+BACKGROUND_POLL_MS = 50
+
+# PyInstaller creates a temp folder and stores path in _MEIPASS; resolved once at import
+_BASE_PATH = getattr(sys, "_MEIPASS", os.path.abspath("."))
+
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 
 class App(b.Window):
@@ -25,8 +33,16 @@ class App(b.Window):
         # Use a modern theme from ttkbootstrap
         super().__init__(themename="litera")
 
-        # Create an instance of our UI theme template
-        self.theme = AppTheme()
+        # Use the shared instance of our UI theme template
+        self.theme = THEME
+
+        self._all_dbs = () # Every database name from the last scan
+        self._dbs = () # The names currently shown in the listbox, by index
+        self._buttons_enabled = None # Last state applied by on_db_select
+        # Finished background jobs, handed over by the pool threads and picked up on the Tk thread
+        self._finished_jobs = queue.SimpleQueue()
+        self._jobs_pending = 0
+        self._poll_after_id = None
 
         self.title("🗃️ Database Manager")
         self.geometry("500x450")
@@ -53,11 +69,19 @@ class App(b.Window):
         manage_frame = b.LabelFrame(main_frame, text="Manage Existing Databases", padding="10")
         manage_frame.pack(fill="both", expand=True, pady=5)
 
-        # Listbox to show databases
+        # Type-to-filter entry; filtering only changes which names the listbox holds
+        filter_frame = b.Frame(manage_frame)
+        filter_frame.pack(fill="x")
+        self.db_filter_var = tk.StringVar()
+        self.db_filter_var.trace_add("write", lambda *args: self._show_databases())
+        b.Label(filter_frame, text="Filter:").pack(side="left", padx=(0, 5))
+        b.Entry(filter_frame, textvariable=self.db_filter_var).pack(side="left", fill="x", expand=True)
+
+        # Virtualized listbox to show databases (only visible rows are drawn)
         list_frame = b.Frame(manage_frame) # Frame to hold listbox and scrollbar
         list_frame.pack(pady=5, fill="both", expand=True)
 
-        self.db_listbox = tk.Listbox(list_frame, height=10, borderwidth=0, highlightthickness=0)
+        self.db_listbox = VirtualListbox(list_frame, height=200)
         self.db_listbox.pack(side="left", fill="both", expand=True)
         self.db_listbox.bind("<<ListboxSelect>>", self.on_db_select)
         self.db_listbox.bind("<Double-1>", self.select_database) # Add double-click handler
@@ -83,19 +107,86 @@ class App(b.Window):
 
         # --- Status Bar ---
         self.status_var = tk.StringVar()
-        self.status_var.set("Ready")
+        self._last_status = None
+        self._set_status("Ready")
         status_bar = b.Label(self, textvariable=self.status_var, relief="sunken", anchor="w", padding=5)
         status_bar.pack(side="bottom", fill="x")
 
         # Initial population of the list
         self.refresh_database_list()
 
-    def refresh_database_list(self):
-        """Clears and repopulates the database listbox."""
+    def _set_status(self, text):
+        """Updates the status bar, skipping the Tcl write when the text is unchanged."""
+        if text != self._last_status:
+            self.status_var.set(text)
+            self._last_status = text
+
+    def _run_in_background(self, callback, func, *args, on_error=None):
+        """
+        Runs func(*args) on the shared I/O pool and passes its result to callback on the Tk thread.
+        If func raises, the error is shown and on_error (if given) is called instead.
+        The pool thread only queues the finished future; all Tk calls happen in _poll_background.
+        """
+        self._jobs_pending += 1
+        future = _EXECUTOR.submit(func, *args)
+        future.add_done_callback(lambda f: self._finished_jobs.put((f, callback, on_error)))
+        if self._poll_after_id is None:
+            self._poll_after_id = self.after(BACKGROUND_POLL_MS, self._poll_background)
+
+    def _poll_background(self):
+        """Delivers finished background jobs, and keeps polling while others are still running."""
+        self._poll_after_id = None
+        while True:
+            try:
+                future, callback, on_error = self._finished_jobs.get_nowait()
+            except queue.Empty:
+                break
+            self._jobs_pending -= 1
+            try:
+                result = future.result()
+            except Exception as e:
+                messagebox.showerror("Error", f"An unexpected error occurred:\n{e}", parent=self)
+                if on_error:
+                    on_error()
+                continue
+            callback(result)
+        # A callback may have started another job, which already restarted the polling
+        if self._jobs_pending and self._poll_after_id is None:
+            self._poll_after_id = self.after(BACKGROUND_POLL_MS, self._poll_background)
+
+    def refresh_database_list(self, select_name=None):
+        """
+        Rescans the databases in the background and repopulates the listbox.
+        If select_name is given, that database is selected once the list is shown.
+        """
+        self._run_in_background(lambda databases: self._apply_db_list(databases, select_name), dbm.list_databases)
+
+    def _apply_db_list(self, databases, select_name=None):
+        """Stores a fresh scan and repopulates the database listbox on the Tk thread."""
+        self._all_dbs = tuple(databases)
+        if select_name is not None and not self._matches_filter(select_name):
+            self.db_filter_var.set("") # Clear the filter so the new database is visible
+        self._show_databases(select_name)
+
+    def _matches_filter(self, db_name):
+        return self.db_filter_var.get().strip().lower() in db_name.lower()
+
+    def _show_databases(self, select_name=None):
+        """Fills the listbox with the databases that match the current filter."""
+        needle = self.db_filter_var.get().strip().lower()
+        if needle:
+            self._dbs = tuple(db for db in self._all_dbs if needle in db.lower())
+        else:
+            self._dbs = self._all_dbs
+        # One bulk delete + one varargs insert; the listbox repaints once when idle.
         self.db_listbox.delete(0, tk.END)
-        databases = dbm.list_databases()
-        for db in databases:
-            self.db_listbox.insert(tk.END, db)
+        self.db_listbox.insert(tk.END, *self._dbs)
+        if select_name is not None:
+            # list_databases returns sorted names, so the position is a binary search away
+            i = bisect.bisect_left(self._dbs, select_name)
+            if i < len(self._dbs) and self._dbs[i] == select_name:
+                self.db_listbox.selection_set(i)
+                self.db_listbox.see(i)
         self.on_db_select() # Update button states
 
     def create_database(self):
@@ -111,13 +202,7 @@ class App(b.Window):
             messagebox.showinfo("Success", message)
             self.new_db_name_var.set("") # Clear the entry box
             # UX Improvement: Automatically select the new database
-            self.refresh_database_list()
-            for i, item in enumerate(self.db_listbox.get(0, tk.END)):
-                if item == db_name:
-                    self.db_listbox.selection_set(i)
-                    self.db_listbox.see(i)
-                    self.on_db_select()
-                    break
+            self.refresh_database_list(select_name=db_name)
         else:
             messagebox.showerror("Error", message)
 
@@ -128,7 +213,7 @@ class App(b.Window):
             messagebox.showwarning("Warning", "Please select a database to delete.")
             return
 
-        db_name = self.db_listbox.get(selected_indices[0])
+        db_name = self._dbs[selected_indices[0]]
         
         # Confirmation dialog
         confirm = messagebox.askyesno(
@@ -157,19 +242,20 @@ class App(b.Window):
         if not selected_indices:
             return
         
-        db_name = self.db_listbox.get(selected_indices[0])
+        db_name = self._dbs[selected_indices[0]]
+        import table_ui # Deferred until a database is first opened to keep startup fast
         # Open the Table Manager window, passing the root window and the db_name
         table_ui.TableManagerWindow(self, db_name)
     def on_db_select(self, event=None):
         """Enables/disables buttons based on listbox selection."""
-        if self.db_listbox.curselection():
-            self.delete_button.config(state="normal")
-            self.select_button.config(state="normal")
-            self.export_sql_button.config(state="normal")
-        else:
-            self.delete_button.config(state="disabled")
-            self.select_button.config(state="disabled")
-            self.export_sql_button.config(state="disabled")
+        enabled = bool(self.db_listbox.curselection())
+        if enabled == self._buttons_enabled:
+            return # Nothing changed; skip the restyle
+        state = "normal" if enabled else "disabled"
+        self.delete_button.config(state=state)
+        self.select_button.config(state=state)
+        self.export_sql_button.config(state=state)
+        self._buttons_enabled = enabled
 
     def export_database_as_sql(self):
         """Handles exporting the selected database to a .sql file."""
@@ -177,12 +263,13 @@ class App(b.Window):
         if not selected_indices:
             return
 
-        db_name = self.db_listbox.get(selected_indices[0])
+        db_name = self._dbs[selected_indices[0]]
 
+        from tkinter import filedialog # Only needed once the user exports
         default_export_dir = dbm.get_default_export_dir()
         filepath = filedialog.asksaveasfilename(
             defaultextension=".sql",
-            filetypes=[("SQL files", "*.sql"), ("All files", "*.*")],
+            filetypes=[("SQL files", "*.sql"), ("Gzipped SQL files", "*.sql.gz"), ("All files", "*.*")],
             title=f"Export '{db_name}' as SQL",
             initialdir=default_export_dir,
             initialfile=f"{db_name}_dump.sql"
@@ -191,7 +278,22 @@ class App(b.Window):
         if not filepath:
             return # User cancelled
 
-        success, message = dbm.dump_database_to_sql(db_name, filepath)
+        # Dumping can take seconds on large databases, so do it off the Tk thread.
+        self.export_sql_button.config(state="disabled")
+        self._set_status(f"Exporting '{db_name}'...")
+        self._run_in_background(self._on_export_done, dbm.dump_database_to_sql, db_name, filepath,
+                                on_error=self._end_export)
+
+    def _end_export(self):
+        """Puts the export button and status bar back once an export has finished, however it ended."""
+        self._buttons_enabled = None # The export button was disabled behind on_db_select's back
+        self.on_db_select() # Re-enable the export button if a database is still selected
+        self._set_status("Ready")
+
+    def _on_export_done(self, result):
+        """Reports the outcome of a background SQL export."""
+        self._end_export()
+        success, message = result
         if success:
             messagebox.showinfo("Export Successful", message, parent=self)
         else:
@@ -1,5 +1,30 @@
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+def _remove_folder(folder):
+    """Removes a single folder tree, reporting (not raising) any error."""
+    try:
+        shutil.rmtree(folder)
+    except OSError as e:
+        print(f"  Error removing {folder}: {e}")
+
+def _find_pycache_folders(path):
+    """
+    Yields every __pycache__ folder below path without descending into them.
+    Uses os.scandir so directory checks come from the cached entry type, not extra stat calls.
+    """
+    try:
+        with os.scandir(path) as entries:
+            subdirs = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except OSError as e:
+        print(f"  Error scanning {path}: {e}")
+        return
+    for entry in subdirs:
+        if entry.name == "__pycache__":
+            yield entry.path
+        else:
+            yield from _find_pycache_folders(entry.path)
 
 def clean_project():
     """
@@ -8,18 +33,17 @@ def clean_project():
     project_root = os.path.dirname(os.path.abspath(__file__))
     print(f"Starting cleanup in: {project_root}\n")
 
-    for root, dirs, files in os.walk(project_root):
-        # Remove __pycache__ directories
-        if "__pycache__" in dirs:
-            pycache_folder = os.path.join(root, "__pycache__")
-            print(f"Removing folder: {pycache_folder}")
-            try:
-                shutil.rmtree(pycache_folder)
-            except OSError as e:
-                print(f"  Error removing {pycache_folder}: {e}")
+    # Collect every __pycache__ folder first
+    targets = []
+    for pycache_folder in _find_pycache_folders(project_root):
+        print(f"Removing folder: {pycache_folder}")
+        targets.append(pycache_folder)
+
+    # Remove them concurrently so disk latency overlaps instead of adding up
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_remove_folder, targets))
 
     print("\nCleanup complete.")
 
 if __name__ == "__main__":
     clean_project()
-
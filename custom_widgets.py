@@ -1,4 +1,21 @@
+import functools
 import tkinter as tk
+import tkinter.font as tkfont
+
+@functools.lru_cache(maxsize=64)
+def _rounded_rect_points(width, height, radius):
+    """
+    Returns the vertices of a rounded rectangle for a smoothed canvas polygon.
+    Points are doubled along the straight edges so the spline only rounds the corners.
+    Cached per size, so buttons of the same dimensions share one precomputed shape.
+    """
+    return (
+        radius, 0, radius, 0, width - radius, 0, width - radius, 0,
+        width, 0, width, radius, width, radius, width, height - radius, width, height - radius,
+        width, height, width - radius, height, width - radius, height, radius, height, radius, height,
+        0, height, 0, height - radius, 0, height - radius, 0, radius, 0, radius,
+        0, 0,
+    )
 
 class CustomButton(tk.Canvas):
     """
@@ -17,52 +34,72 @@ class CustomButton(tk.Canvas):
         
         self.command = command
         self.theme = theme
+        # Resolve the theme's colors once: (bg, fg) per visual state
+        style = theme.button
+        self._palette = {
+            tk.DISABLED: (style["disabled_bg"], style["disabled_fg"]),
+            "hover": (style["hover_bg"], style["normal_fg"]),
+            tk.NORMAL: (style["normal_bg"], style["normal_fg"]),
+        }
+        self._font = style["font"]
         self.state = state
         self._text = text
         self._hovering = False
+        self._redraw_pending = False
+        self._width, self._height = 100, 35 # Kept in sync by <Configure>, no winfo_* round trips
 
-        # --- Draw the initial button state ---
+        # --- Create the canvas items once; state changes only recolor them ---
+        # A single smoothed polygon forms the rounded rectangle (no overlapping shapes)
+        self._bg_id = self.create_polygon(0, 0, 0, 0, 0, 0, smooth=True, splinesteps=12)
+        self._text_id = self.create_text(0, 0, text=self._text, font=self._font)
+        self._layout()
         self._draw_button()
         
         # --- Bind events for interaction ---
+        self.bind("<Configure>", self._layout)
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
         self.bind("<Button-1>", self._on_click)
 
-    def _draw_button(self):
-        """Draws the button based on its current state."""
-        self.delete("all") # Clear the canvas before redrawing
-        width = self.winfo_width()
-        height = self.winfo_height()
+    def _layout(self, event=None):
+        """Positions the button's shapes and text for the current canvas size."""
+        if event is not None:
+            self._width, self._height = event.width, event.height
+        width, height = self._width, self._height
         radius = height // 2
 
-        # Determine colors from the theme object
+        self.coords(self._bg_id, *_rounded_rect_points(width, height, radius))
+        self.coords(self._text_id, width / 2, height / 2)
+
+    def _draw_button(self):
+        """Recolors the button based on its current state."""
         if self.state == tk.DISABLED:
-            bg_color = self.theme.button["disabled_bg"]
-            fg_color = self.theme.button["disabled_fg"]
-        elif self._hovering:
-            bg_color = self.theme.button["hover_bg"]
-            fg_color = self.theme.button["normal_fg"]
+            key = tk.DISABLED
         else:
-            bg_color = self.theme.button["normal_bg"]
-            fg_color = self.theme.button["normal_fg"]
+            key = "hover" if self._hovering else tk.NORMAL
+        bg_color, fg_color = self._palette[key]
 
-        # Draw the rounded rectangle shape
-        self.create_oval(0, 0, height, height, fill=bg_color, outline=bg_color)
-        self.create_oval(width - height, 0, width, height, fill=bg_color, outline=bg_color)
-        self.create_rectangle(radius, 0, width - radius, height, fill=bg_color, outline=bg_color)
-        
-        # Draw the button text
-        self.create_text(width / 2, height / 2, text=self._text, fill=fg_color, font=self.theme.button["font"])
+        self.itemconfigure(self._bg_id, fill=bg_color, outline=bg_color)
+        self.itemconfigure(self._text_id, fill=fg_color)
+
+    def _schedule_redraw(self):
+        """Coalesces bursts of hover/state changes into at most one redraw per idle cycle."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        self._redraw_pending = False
+        self._draw_button()
 
     def _on_enter(self, event):
         if self.state == tk.NORMAL:
             self._hovering = True
-            self._draw_button()
+            self._schedule_redraw()
 
     def _on_leave(self, event):
         self._hovering = False
-        self._draw_button()
+        self._schedule_redraw()
 
     def _on_click(self, event):
         if self.state == tk.NORMAL and self.command:
@@ -72,6 +109,180 @@ class CustomButton(tk.Canvas):
         """Allows configuring the button's state after creation."""
         if 'state' in kwargs:
             self.state = kwargs['state']
-            self._draw_button()
+            self._schedule_redraw()
         super().config(**kwargs)
 
+
+class VirtualListbox(tk.Canvas):
+    """
+    A virtualized, Listbox-compatible list widget.
+    Items are kept in a plain Python list and only the rows currently in view are
+    drawn, so repopulating or scrolling costs O(visible rows) instead of O(items).
+    Supports the subset of the tk.Listbox API used by the application.
+    """
+    def __init__(self, parent, **kwargs):
+        # --- Widget Setup ---
+        # Match the themed input colors when running under ttkbootstrap.
+        try:
+            colors = parent.winfo_toplevel().style.colors
+            self._bg, self._fg = colors.inputbg, colors.inputfg
+            self._select_bg, self._select_fg = colors.selectbg, colors.selectfg
+        except (AttributeError, tk.TclError):
+            self._bg, self._fg = "white", "black" # Fallback for standard tkinter
+            self._select_bg, self._select_fg = "#0078d7", "white"
+
+        self._yscrollcommand = kwargs.pop("yscrollcommand", None)
+        super().__init__(parent, bg=self._bg, borderwidth=0, highlightthickness=0, takefocus=1, **kwargs)
+
+        self._items = []
+        self._selected = None # Index of the selected item, or None
+        self._top = 0 # Index of the first visible row
+        self._row_height = tkfont.nametofont("TkDefaultFont").metrics("linespace") + 4
+        self._visible_rows = 1
+        self._redraw_pending = False
+
+        # --- Bind events for interaction ---
+        self.bind("<Configure>", self._on_configure)
+        self.bind("<Button-1>", self._on_click)
+        self.bind("<MouseWheel>", self._on_mousewheel)
+        self.bind("<Button-4>", lambda e: self.yview_scroll(-1, "units")) # X11 wheel up
+        self.bind("<Button-5>", lambda e: self.yview_scroll(1, "units")) # X11 wheel down
+        self.bind("<Up>", lambda e: self._move_selection(-1))
+        self.bind("<Down>", lambda e: self._move_selection(1))
+
+    # --- Listbox-compatible API ---
+    def insert(self, index, *elements):
+        """Inserts one or more items before the given index."""
+        index = self._index(index)
+        self._items[index:index] = elements
+        if self._selected is not None and self._selected >= index:
+            self._selected += len(elements)
+        self._schedule_redraw()
+
+    def delete(self, first, last=None):
+        """Deletes the items from first to last (inclusive)."""
+        first = self._index(first)
+        last = first if last is None else min(self._index(last), len(self._items) - 1)
+        if last < first:
+            return
+        del self._items[first:last + 1]
+        if self._selected is not None:
+            if first <= self._selected <= last:
+                self._selected = None
+            elif self._selected > last:
+                self._selected -= last - first + 1
+        self._top = max(0, min(self._top, len(self._items) - self._visible_rows))
+        self._schedule_redraw()
+
+    def get(self, first, last=None):
+        """Returns the item at first, or a tuple of the items from first to last (inclusive)."""
+        if last is None:
+            return self._items[self._index(first)]
+        return tuple(self._items[self._index(first):self._index(last) + 1])
+
+    def size(self):
+        return len(self._items)
+
+    def curselection(self):
+        return () if self._selected is None else (self._selected,)
+
+    def selection_set(self, index):
+        self._selected = self._index(index)
+        self._schedule_redraw()
+
+    def selection_clear(self, first=0, last=None):
+        self._selected = None
+        self._schedule_redraw()
+
+    def see(self, index):
+        """Scrolls the view so the given item is visible."""
+        index = self._index(index)
+        if index < self._top:
+            self._top = index
+        elif index >= self._top + self._visible_rows:
+            self._top = index - self._visible_rows + 1
+        self._schedule_redraw()
+
+    def yview(self, *args):
+        """Scrollbar protocol: query the view, or handle 'moveto'/'scroll' commands."""
+        if not args:
+            return self._view_fractions()
+        if args[0] == "moveto":
+            self.yview_moveto(args[1])
+        elif args[0] == "scroll":
+            self.yview_scroll(args[1], args[2])
+
+    def yview_moveto(self, fraction):
+        self._top = int(float(fraction) * len(self._items))
+        self._schedule_redraw()
+
+    def yview_scroll(self, number, what):
+        step = self._visible_rows if what == "pages" else 1
+        self._top += int(number) * step
+        self._schedule_redraw()
+
+    def configure(self, cnf=None, **kwargs):
+        """Intercepts yscrollcommand so the canvas' own scroll region never drives the scrollbar."""
+        if "yscrollcommand" in kwargs:
+            self._yscrollcommand = kwargs.pop("yscrollcommand")
+            self._schedule_redraw()
+        return super().configure(cnf, **kwargs)
+
+    config = configure
+
+    # --- Internal helpers ---
+    def _index(self, index):
+        return len(self._items) if index == tk.END else int(index)
+
+    def _view_fractions(self):
+        count = len(self._items)
+        if not count:
+            return 0.0, 1.0
+        return self._top / count, min(1.0, (self._top + self._visible_rows) / count)
+
+    def _schedule_redraw(self):
+        """Coalesces any number of model changes into a single repaint on the next idle cycle."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._redraw)
+
+    def _redraw(self):
+        """Draws only the rows inside the current view window."""
+        self._redraw_pending = False
+        count = len(self._items)
+        self._top = max(0, min(self._top, count - self._visible_rows))
+        super().delete("row") # Canvas item deletion; self.delete() removes list items
+        width = self.winfo_width()
+        row_h = self._row_height
+        for i in range(self._top, min(count, self._top + self._visible_rows + 1)):
+            y = (i - self._top) * row_h
+            fg = self._fg
+            if i == self._selected:
+                self.create_rectangle(0, y, width, y + row_h, fill=self._select_bg, outline="", tags="row")
+                fg = self._select_fg
+            self.create_text(4, y + row_h / 2, anchor="w", text=self._items[i], fill=fg, tags="row")
+        if self._yscrollcommand:
+            self._yscrollcommand(*self._view_fractions())
+
+    def _on_configure(self, event):
+        self._visible_rows = max(1, event.height // self._row_height)
+        self._schedule_redraw()
+
+    def _on_click(self, event):
+        self.focus_set()
+        index = self._top + event.y // self._row_height
+        if index < len(self._items):
+            self._selected = index
+            self._schedule_redraw()
+            self.event_generate("<<ListboxSelect>>")
+
+    def _on_mousewheel(self, event):
+        self.yview_scroll(-1 if event.delta > 0 else 1, "units")
+
+    def _move_selection(self, offset):
+        if not self._items:
+            return
+        current = self._selected if self._selected is not None else -offset
+        self._selected = max(0, min(len(self._items) - 1, current + offset))
+        self.see(self._selected)
+        self.event_generate("<<ListboxSelect>>")
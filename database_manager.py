@@ -1,5 +1,12 @@
 import os
+import atexit
+import functools
+import gzip
+import itertools
 import sqlite3
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
 def get_app_data_dir():
     """
@@ -30,32 +37,149 @@ def get_db_path(db_name):
     """Constructs the full path for a database file."""
     return os.path.join(DB_ROOT_DIR, f"{db_name}.db")
 
+# Connections are cached per (thread, database) and reused for the life of the process,
+# which avoids reopening the file and re-running setup PRAGMAs on every call.
+_conn_cache = {}
+_conn_lock = threading.RLock()
+
+# Applied once per connection: WAL with NORMAL sync groups commits instead of fsyncing each one,
+# and a 64 MB page cache, in-memory temp tables and 256 MB of mmap speed up reads.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA foreign_keys = ON;
+"""
+
 def get_db_connection(db_name):
-    """Establishes a connection to the specified database."""
+    """
+    Returns this thread's cached connection to the specified database, opening it on first use.
+    Callers must not close the returned connection; use close_db_connection instead.
+    """
+    key = (threading.get_ident(), db_name)
+    conn = _conn_cache.get(key)
+    if conn is not None:
+        return conn
+
     db_path = get_db_path(db_name)
     try:
-        conn = sqlite3.connect(db_path)
-        # Enable foreign key support for the connection
-        conn.execute("PRAGMA foreign_keys = ON")
+        # Each connection is only used by the thread that opened it; check_same_thread=False
+        # just lets close_db_connection close it from whichever thread deletes the database.
+        # A larger statement cache keeps the prepared DML for many tables around
+        conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+        # journal_mode returns the resulting mode; WAL can be refused (e.g. on network filesystems)
+        journal_mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        if journal_mode.lower() != "wal":
+            print(f"Warning: WAL mode unavailable for {db_name}, using '{journal_mode}' journal mode.")
+        # Also enables foreign key support for the connection
+        conn.executescript(_CONNECTION_PRAGMAS)
+    except sqlite3.Error as e:
+        print(f"Error connecting to database {db_name}: {e}")
+        return None
+
+    with _conn_lock:
+        _conn_cache[key] = conn
+    return conn
+
+# Read tuning for read-only connections; journal mode and foreign keys only matter to writers
+_READONLY_PRAGMAS = """
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+    PRAGMA mmap_size = 268435456;
+"""
+
+def get_readonly_connection(db_name):
+    """
+    Returns this thread's cached read-only connection to the specified database.
+    Used for metadata and data reads: it can't write by accident, and never creates a missing file.
+    """
+    key = (threading.get_ident(), db_name, 'ro')
+    conn = _conn_cache.get(key)
+    if conn is not None:
         return conn
+
+    db_path = get_db_path(db_name)
+    try:
+        uri = f"file:{urllib.request.pathname2url(db_path)}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+        conn.executescript(_READONLY_PRAGMAS)
     except sqlite3.Error as e:
         print(f"Error connecting to database {db_name}: {e}")
         return None
 
+    with _conn_lock:
+        _conn_cache[key] = conn
+    return conn
+
+def _close_connection(conn, readonly=False):
+    """Lets SQLite refresh its query planner statistics, then closes the connection."""
+    if not readonly: # Read-only connections can't store statistics
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass # Optimizing is best-effort; never block the close
+    conn.close()
+
+def close_db_connection(db_name):
+    """
+    Closes every cached connection to a database, e.g. before its file is deleted.
+    Its schema snapshot is dropped too: a new file under the same name restarts schema_version.
+    """
+    with _conn_lock:
+        keys = [key for key in _conn_cache if key[1] == db_name]
+        conns = [(_conn_cache.pop(key), len(key) == 3) for key in keys]
+    _schema_cache.pop(db_name, None)
+    for conn, readonly in conns:
+        _close_connection(conn, readonly)
+
+def close_thread_connections(db_name):
+    """Closes the calling thread's cached connections to a database, if it has any."""
+    ident = threading.get_ident()
+    with _conn_lock:
+        rw_conn = _conn_cache.pop((ident, db_name), None)
+        ro_conn = _conn_cache.pop((ident, db_name, 'ro'), None)
+    if rw_conn is not None:
+        _close_connection(rw_conn)
+    if ro_conn is not None:
+        _close_connection(ro_conn, readonly=True)
+
+@atexit.register
+def close_all_connections():
+    """Closes all cached connections; registered to run at interpreter exit."""
+    with _conn_lock:
+        conns = [(conn, len(key) == 3) for key, conn in _conn_cache.items()]
+        _conn_cache.clear()
+    for conn, readonly in conns:
+        _close_connection(conn, readonly)
+
 # --- Database Level Operations ---
+# Last directory scan, reused until the directory's mtime changes
+_db_list_cache = {'mtime': None, 'names': []}
+
 def list_databases():
     """Returns a list of database names without the .db extension."""
     initialize_root_directory()
     try:
-        files = [f for f in os.listdir(DB_ROOT_DIR) if f.endswith('.db')]
-        return sorted([os.path.splitext(f)[0] for f in files])
+        mtime = os.stat(DB_ROOT_DIR).st_mtime_ns
+        if mtime != _db_list_cache['mtime']:
+            with os.scandir(DB_ROOT_DIR) as entries:
+                names = [entry.name[:-3] for entry in entries if entry.name.endswith('.db')]
+            names.sort()
+            _db_list_cache['mtime'], _db_list_cache['names'] = mtime, names
+        return list(_db_list_cache['names'])
     except OSError:
         return []
 
+def _invalidate_db_list_cache():
+    """Forces the next list_databases call to rescan (mtime resolution can be coarse)."""
+    _db_list_cache['mtime'] = None
+
+@functools.lru_cache(maxsize=None)
 def get_default_export_dir():
     """
     Gets a default export directory inside the user's Documents folder.
-    Creates it if it doesn't exist.
+    Creates it if it doesn't exist. The path can't change while the app runs, so it is worked out once.
     """
     # os.path.expanduser("~") gets the user's home directory on any OS
     docs_path = os.path.join(os.path.expanduser("~"), "Documents")
@@ -72,6 +196,7 @@ def create_database(db_name):
     try:
         conn = sqlite3.connect(db_path)
         conn.close()
+        _invalidate_db_list_cache()
         return True, f"Database '{db_name}' created successfully."
     except sqlite3.Error as e:
         return False, f"Failed to create database: {e}"
@@ -82,13 +207,24 @@ def delete_database(db_name):
     if not os.path.exists(db_path):
         return False, f"Database '{db_name}' not found."
     try:
+        close_db_connection(db_name) # Release the file handle before removing it
         os.remove(db_path)
+        # Remove any WAL sidecar files SQLite didn't already clean up on close
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+        _invalidate_db_list_cache()
         return True, f"Database '{db_name}' deleted successfully."
     except OSError as e:
         return False, str(e)
 
+_DUMP_CHUNK_SIZE = 1 << 16 # Flush accumulated dump lines in ~64 KB chunks
+
 def dump_database_to_sql(db_name, output_filepath):
-    """Dumps the entire database schema and data to a .sql file."""
+    """
+    Dumps the entire database schema and data to a .sql file.
+    A path ending in .gz is written gzip-compressed.
+    """
     conn = get_db_connection(db_name)
 
 
@@ -96,88 +232,171 @@ def dump_database_to_sql(db_name, output_filepath):
         return False, "Could not connect to the database."
     
     try:
-        with open(output_filepath, 'w', encoding='utf-8') as f:
+        if output_filepath.endswith('.gz'):
+            f = gzip.open(output_filepath, 'wb', compresslevel=1)
+        else:
+            f = open(output_filepath, 'wb', buffering=1 << 20)
+        with f:
+            # Stream iterdump() into large chunks instead of one small write per line
+            chunk = bytearray()
             for line in conn.iterdump():
-                f.write('%s\n' % line)
+                chunk += line.encode('utf-8')
+                chunk += b'\n'
+                if len(chunk) >= _DUMP_CHUNK_SIZE:
+                    f.write(chunk)
+                    chunk.clear()
+            if chunk:
+                f.write(chunk)
         return True, f"Database successfully dumped to {output_filepath}"
     except (IOError, sqlite3.Error) as e:
         return False, f"Failed to dump database: {e}"
-    finally:
-        if conn:
-            conn.close()
 
 # --- Schema Introspection ---
 def list_tables(db_name):
     """Lists all tables in a given database."""
-    conn = get_db_connection(db_name)
+    conn = get_readonly_connection(db_name)
     if not conn:
         return []
     cursor = conn.cursor()
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
     tables = [row[0] for row in cursor.fetchall()]
-    conn.close()
     return tables
 
+def _list_tables_in_worker(db_name):
+    """Runs list_tables on a pool thread and closes that thread's connection afterwards."""
+    try:
+        return list_tables(db_name)
+    finally:
+        close_thread_connections(db_name)
+
+def list_tables_bulk(db_names):
+    """
+    Lists the tables of several databases at once, returning {db_name: [tables]}.
+    Each database is read on its own worker thread and connection; sqlite3 releases
+    the GIL while it works, so the opens and queries overlap.
+    """
+    if not db_names:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(db_names))) as executor:
+        return dict(zip(db_names, executor.map(_list_tables_in_worker, db_names)))
+
+# SQLite projects just the needed table_info columns; rows zip straight onto these keys
+_COLUMN_INFO_SQL = 'SELECT name, type, "notnull", pk FROM pragma_table_info(?)'
+_COLUMN_INFO_KEYS = ('name', 'type', 'notnull', 'pk')
+
 def get_table_columns(db_name, table_name):
     """
     Returns a list of column dictionaries for a given table, including their properties.
-    Uses PRAGMA table_info.
+    Uses the pragma_table_info table-valued function, so the table name is a bound parameter.
     """
-    conn = get_db_connection(db_name)
+    conn = get_readonly_connection(db_name)
     if not conn:
         return []
     cursor = conn.cursor()
     try:
-        cursor.execute(f"PRAGMA table_info('{table_name}')")
-        # Row: (cid, name, type, notnull, dflt_value, pk)
-        cols = [{'name': row[1], 'type': row[2], 'notnull': row[3], 'pk': row[5]} for row in cursor.fetchall()]
-        return cols
+        cursor.execute(_COLUMN_INFO_SQL, (table_name,))
+        return [dict(zip(_COLUMN_INFO_KEYS, row)) for row in cursor]
     except sqlite3.Error as e:
         print(f"Error getting columns for {table_name}: {e}")
         return []
-    finally:
-        conn.close()
+
+# Introspection results per database, reused until SQLite's schema_version changes
+_schema_cache = {}
+
+def get_schema_snapshot(db_name):
+    """
+    Returns a dict describing every table in the database:
+    {table: {'columns': [...], 'pk': [...], 'indexes': [...], 'fks': {...}, 'schema_sql': ...}}
+    Built in a single introspection pass and cached until the schema_version changes.
+    Treat the result as read-only; it is shared between callers.
+    """
+    conn = get_readonly_connection(db_name)
+    if not conn:
+        return {}
+    cursor = conn.cursor()
+
+    try:
+        schema_version = cursor.execute("PRAGMA schema_version").fetchone()[0]
+        cached = _schema_cache.get(db_name)
+        if cached and cached[0] == schema_version:
+            return cached[1]
+
+        snapshot = {}
+        cursor.execute("SELECT name, sql FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
+        for table_name, schema_sql in cursor.fetchall():
+            # Table-valued pragma functions take the name as a bound parameter, so the
+            # statement text is the same for every table and stays in the statement cache.
+            cursor.execute(_COLUMN_INFO_SQL, (table_name,))
+            columns = [dict(zip(_COLUMN_INFO_KEYS, row)) for row in cursor]
+
+            indexes = []
+            cursor.execute('SELECT name, "unique", origin FROM pragma_index_list(?)', (table_name,))
+            for index_name, unique, origin in cursor.fetchall():
+                cursor.execute("SELECT name FROM pragma_index_info(?)", (index_name,))
+                index_cols = [info[0] for info in cursor.fetchall()]
+                indexes.append({'name': index_name, 'unique': bool(unique), 'origin': origin, 'columns': index_cols})
+
+            cursor.execute('SELECT "from", "table", "to" FROM pragma_foreign_key_list(?)', (table_name,))
+            fks = {row[0]: {'table': row[1], 'to': row[2]} for row in cursor.fetchall()}
+
+            pk = [c['name'] for c in columns if c['pk'] > 0]
+            # Columns under a UNIQUE constraint, and the valid FK targets (PK columns plus
+            # columns of explicit unique indexes, not the implicit ones SQLite creates itself)
+            unique_cols = {col for index in indexes if index['unique'] and index['origin'] == 'u' for col in index['columns']}
+            fk_targets = list(dict.fromkeys(pk + [
+                col for index in indexes
+                if index['unique'] and not index['name'].startswith('sqlite_autoindex_')
+                for col in index['columns']
+            ]))
+
+            snapshot[table_name] = {
+                'columns': columns,
+                'pk': pk,
+                'unique_cols': unique_cols,
+                'fk_targets': fk_targets,
+                'indexes': indexes,
+                'fks': fks,
+                'schema_sql': schema_sql,
+            }
+
+        _schema_cache[db_name] = (schema_version, snapshot)
+        return snapshot
+    except sqlite3.Error as e:
+        print(f"Error reading schema of {db_name}: {e}")
+        return {}
+
+def _get_table_snapshot(db_name, table_name):
+    """Returns one table's entry from the schema snapshot, or None if it doesn't exist."""
+    return get_schema_snapshot(db_name).get(table_name)
 
 def get_full_table_definition(db_name, table_name):
     """
     Reads a table's full schema and returns it in the format used by create_table.
     Note: This is a best-effort parser and may not capture all complex constraints like multi-column UNIQUE or CHECK.
     """
-    conn = get_db_connection(db_name)
-    if not conn: return []
-    cursor = conn.cursor()
+    snap = _get_table_snapshot(db_name, table_name)
+    if not snap: return []
+
+    # 1. Basic column info
+    defs = {c['name']: {'name': c['name'], 'type': c['type'], 'not_null': bool(c['notnull']), 'pk': bool(c['pk'])} for c in snap['columns']}
     
-    try:
-        # 1. Basic info from table_info
-        cursor.execute(f"PRAGMA table_info('{table_name}')")
-        cols_info = cursor.fetchall()
-        defs = {row[1]: {'name': row[1], 'type': row[2], 'not_null': bool(row[3]), 'pk': bool(row[5])} for row in cols_info}
-        
-        # Check for autoincrement
-        pk_cols = [k for k, v in defs.items() if v['pk']]
-        if len(pk_cols) == 1 and defs[pk_cols[0]]['type'] == 'INTEGER':
-            schema = get_table_schema(conn, table_name)
-            if "AUTOINCREMENT" in schema.upper():
-                defs[pk_cols[0]]['autoincrement'] = True
-
-        # 2. Unique constraints from index_list
-        cursor.execute(f"PRAGMA index_list('{table_name}')")
-        for index in cursor.fetchall():
-            if index[2] and index[3] == 'u': # is_unique and is a UNIQUE constraint
-                cursor.execute(f"PRAGMA index_info('{index[1]}')")
-                for info in cursor.fetchall():
-                    if info[2] in defs: defs[info[2]]['unique'] = True
-        
-        # 3. Foreign keys from foreign_key_list
-        cursor.execute(f"PRAGMA foreign_key_list('{table_name}')")
-        for fk in cursor.fetchall():
-            if fk[3] in defs:
-                defs[fk[3]]['fk_table'] = fk[2]
-                defs[fk[3]]['fk_column'] = fk[4]
-                
-        return list(defs.values())
-    finally:
-        conn.close()
+    # Check for autoincrement
+    pk_cols = [k for k, v in defs.items() if v['pk']]
+    if len(pk_cols) == 1 and defs[pk_cols[0]]['type'] == 'INTEGER':
+        if "AUTOINCREMENT" in snap['schema_sql'].upper():
+            defs[pk_cols[0]]['autoincrement'] = True
+
+    # 2. Unique constraints
+    for col_name in snap['unique_cols']:
+        if col_name in defs: defs[col_name]['unique'] = True
+    
+    # 3. Foreign keys
+    for col_name, fk in snap['fks'].items():
+        if col_name in defs:
+            defs[col_name]['fk_table'] = fk['table']
+            defs[col_name]['fk_column'] = fk['to']
+            
+    return list(defs.values())
 
 def get_valid_fk_target_columns(db_name, table_name):
     """
@@ -185,95 +404,44 @@ def get_valid_fk_target_columns(db_name, table_name):
     These are the only valid targets for a foreign key reference in SQLite.
     Returns a list of column names.
     """
-    conn = get_db_connection(db_name)
-    if not conn:
+    snap = _get_table_snapshot(db_name, table_name)
+    if not snap:
         return []
 
-    target_columns = []
-    cursor = conn.cursor()
-
-    try:
-        # 1. Get Primary Key columns from PRAGMA table_info
-        cursor.execute(f"PRAGMA table_info('{table_name}')")
-        table_info = cursor.fetchall()
-        # table_info row: (cid, name, type, notnull, dflt_value, pk)
-        pk_cols = [row[1] for row in table_info if row[5] > 0]
-        target_columns.extend(pk_cols)
-
-        # 2. Get columns from UNIQUE indexes
-        cursor.execute(f"PRAGMA index_list('{table_name}')")
-        indexes = cursor.fetchall()
-        # indexes row: (seq, name, unique, origin, partial)
-        # We only care about explicit UNIQUE constraints, not implicit ones for PRIMARY KEYs
-        unique_indexes = [row[1] for row in indexes if row[2] == 1 and not row[1].startswith('sqlite_autoindex_')]
-
-        for index_name in unique_indexes:
-            cursor.execute(f"PRAGMA index_info('{index_name}')")
-            # index_info row: (seqno, cid, name)
-            index_cols = cursor.fetchall()
-            for row in index_cols:
-                col_name = row[2]
-                if col_name not in target_columns:
-                    target_columns.append(col_name)
-
-    except sqlite3.Error as e:
-        print(f"Error getting key columns for {table_name}: {e}")
-    finally:
-        conn.close()
-
-    return target_columns
+    # Primary Key columns followed by columns from explicit UNIQUE indexes, worked out once per snapshot
+    return list(snap['fk_targets'])
 
 def get_column_type(db_name, table_name, column_name):
     """Gets the data type of a specific column."""
-    conn = get_db_connection(db_name)
-    if not conn:
+    snap = _get_table_snapshot(db_name, table_name)
+    if not snap:
         return None
-    cursor = conn.cursor()
-    try:
-        cursor.execute(f"PRAGMA table_info('{table_name}')")
-        for row in cursor.fetchall():
-            if row[1] == column_name:
-                return row[2] # The 'type' column
-        return None
-    except sqlite3.Error as e:
-        print(f"Error getting column type: {e}")
-        return None
-    finally:
-        conn.close()
+    for col in snap['columns']:
+        if col['name'] == column_name:
+            return col['type']
+    return None
 
 def get_table_schema(conn, table_name):
     """Gets the CREATE statement for a table."""
     cursor = conn.cursor()
-    cursor.execute(f"SELECT sql FROM sqlite_master WHERE type='table' AND name='{table_name}'")
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
     result = cursor.fetchone()
     return result[0] if result else None
 
 def get_primary_key_columns(db_name, table_name):
     """Returns a list of the primary key column names for a table."""
-    cols = get_table_columns(db_name, table_name)
-    return [c['name'] for c in cols if c['pk']]
+    snap = _get_table_snapshot(db_name, table_name)
+    return list(snap['pk']) if snap else []
 
 def get_foreign_key_info(db_name, table_name):
     """
     Gets foreign key relationships for a table.
     Returns a dict: {'column_name': {'table': 'parent_table', 'to': 'parent_column'}}
     """
-    conn = get_db_connection(db_name)
-    if not conn:
+    snap = _get_table_snapshot(db_name, table_name)
+    if not snap:
         return {}
-    try:
-        cursor = conn.cursor()
-        cursor.execute(f"PRAGMA foreign_key_list('{table_name}')")
-        fk_info = {}
-        # Row: (id, seq, table, from, to, on_update, on_delete, match)
-        for row in cursor.fetchall():
-            fk_info[row[3]] = {'table': row[2], 'to': row[4]}
-        return fk_info
-    except sqlite3.Error as e:
-        print(f"Error getting FK info for {table_name}: {e}")
-        return {}
-    finally:
-        conn.close()
+    return {col_name: dict(fk) for col_name, fk in snap['fks'].items()}
 
 # --- Private Helpers ---
 def _generate_create_table_sql(table_name, columns_defs):
@@ -281,11 +449,12 @@ def _generate_create_table_sql(table_name, columns_defs):
     col_strings = []
     pk_cols = []
     fk_defs = []
+    single_pk = sum(1 for c in columns_defs if c.get('pk')) == 1 # Counted once, not per column
 
     for col in columns_defs:
         parts = [f'"{col["name"]}"', col["type"]]
         # Handle single-column Primary Key defined inline
-        if col.get('pk') and len([c for c in columns_defs if c.get('pk')]) == 1:
+        if col.get('pk') and single_pk:
             parts.append("PRIMARY KEY")
             if col.get('autoincrement'):
                 parts.append("AUTOINCREMENT")
@@ -306,6 +475,14 @@ def _generate_create_table_sql(table_name, columns_defs):
     col_strings.extend(fk_defs)
     return f'CREATE TABLE "{table_name}" (\n  ' + ",\n  ".join(col_strings) + "\n);"
 
+# Suffixes for the temporary tables used to rebuild a table; they only need to be unique,
+# and the pid keeps them clear of any table orphaned by an earlier crashed run.
+_temp_table_counter = itertools.count()
+_PID = os.getpid()
+
+def _temp_table_name(table_name):
+    return f"{table_name}_old_{next(_temp_table_counter)}_{_PID}"
+
 # --- Schema Modification ---
 def create_table(db_name, table_name, columns_defs):
     """
@@ -323,9 +500,8 @@ def create_table(db_name, table_name, columns_defs):
         conn.commit()
         return True, f"Table '{table_name}' created successfully."
     except sqlite3.Error as e:
+        conn.rollback()
         return False, f"Failed to create table: {e}"
-    finally:
-        conn.close()
 
 def add_foreign_key(db_name, table_name, column_name, target_table, target_column):
     """
@@ -347,9 +523,8 @@ def add_foreign_key(db_name, table_name, column_name, target_table, target_colum
         if not original_schema:
             raise sqlite3.Error(f"Table '{table_name}' not found.")
             
-        cursor.execute(f"PRAGMA table_info('{table_name}')")
-        columns_info = cursor.fetchall()
-        column_names = [info[1] for info in columns_info]
+        cursor.execute("SELECT name FROM pragma_table_info(?)", (table_name,))
+        column_names = [info[0] for info in cursor.fetchall()]
         column_names_str = ", ".join(f'"{col}"' for col in column_names)
 
         # 2. Create the new schema with the foreign key
@@ -361,7 +536,7 @@ def add_foreign_key(db_name, table_name, column_name, target_table, target_colum
         )
         
         # 3. Rename old table
-        temp_table_name = f"{table_name}_old_{os.urandom(4).hex()}"
+        temp_table_name = _temp_table_name(table_name)
         cursor.execute(f'ALTER TABLE "{table_name}" RENAME TO "{temp_table_name}";')
 
         # 4. Create the new table
@@ -381,7 +556,6 @@ def add_foreign_key(db_name, table_name, column_name, target_table, target_colum
         return False, f"Failed to add foreign key: {e}"
     finally:
         cursor.execute("PRAGMA foreign_keys=ON;")
-        conn.close()
 
 def delete_table(db_name, table_name):
     """Deletes a table from the database."""
@@ -397,9 +571,27 @@ def delete_table(db_name, table_name):
         conn.commit()
         return True, f"Table '{table_name}' deleted successfully."
     except sqlite3.Error as e:
+        conn.rollback()
         return False, f"Failed to delete table: {e}"
-    finally:
-        conn.close()
+
+def delete_tables(db_name, table_names):
+    """Deletes several tables in one transaction: either all of them are dropped or none are."""
+    if len(table_names) == 1:
+        return delete_table(db_name, table_names[0])
+    conn = get_db_connection(db_name)
+    if not conn:
+        return False, "Could not connect to the database."
+
+    try:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN TRANSACTION;")
+        for table_name in table_names:
+            cursor.execute(f'DROP TABLE "{table_name}"')
+        conn.commit()
+        return True, f"{len(table_names)} tables deleted successfully."
+    except sqlite3.Error as e:
+        conn.rollback()
+        return False, f"Failed to delete tables: {e}"
 
 def add_column(db_name, table_name, column_def):
     """Adds a new column to a table using ALTER TABLE."""
@@ -426,9 +618,8 @@ def add_column(db_name, table_name, column_def):
         conn.commit()
         return True, "Column added successfully."
     except sqlite3.Error as e:
+        conn.rollback()
         return False, f"Failed to add column: {e}"
-    finally:
-        conn.close()
 
 def remove_column(db_name, table_name, column_to_remove):
     """
@@ -445,15 +636,15 @@ def remove_column(db_name, table_name, column_to_remove):
     cursor = conn.cursor()
 
     try:
-        # Check if column is referenced by another table's FK
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        for row in cursor.fetchall():
-            other_table = row[0]
-            if other_table == table_name: continue
-            cursor.execute(f"PRAGMA foreign_key_list('{other_table}')")
-            for fk in cursor.fetchall():
-                if fk[2] == table_name and fk[4] == column_to_remove:
-                    return False, f"Cannot remove column '{column_to_remove}' because it is referenced by a foreign key in table '{other_table}'."
+        # Check if column is referenced by another table's FK (one query over every table's FK list)
+        cursor.execute(
+            'SELECT m.name FROM sqlite_master m, pragma_foreign_key_list(m.name) p '
+            'WHERE m.type=\'table\' AND m.name != ? AND p."table" = ? AND p."to" = ? LIMIT 1',
+            (table_name, table_name, column_to_remove)
+        )
+        row = cursor.fetchone()
+        if row:
+            return False, f"Cannot remove column '{column_to_remove}' because it is referenced by a foreign key in table '{row[0]}'."
 
         # Get full definition and filter out the column
         full_defs = get_full_table_definition(db_name, table_name)
@@ -469,7 +660,7 @@ def remove_column(db_name, table_name, column_to_remove):
         cursor.execute("BEGIN TRANSACTION;")
         
         # 1. Rename old table
-        temp_table_name = f"{table_name}_old_{os.urandom(4).hex()}"
+        temp_table_name = _temp_table_name(table_name)
         cursor.execute(f'ALTER TABLE "{table_name}" RENAME TO "{temp_table_name}";')
         
         # 2. Create new table (re-implementing create_table logic for the transaction)
@@ -485,29 +676,152 @@ def remove_column(db_name, table_name, column_to_remove):
         cursor.execute("ROLLBACK;")
         return False, f"Failed to remove column: {e}"
     finally:
-        if conn: cursor.execute("PRAGMA foreign_keys=ON;"); conn.close()
+        cursor.execute("PRAGMA foreign_keys=ON;")
 
 # --- Data Manipulation ---
-def get_table_data(db_name, table_name):
-    """Fetches all data and headers for a given table."""
-    conn = get_db_connection(db_name)
-    if not conn:
-        return [], []
+# Built DML strings keyed by table and column names (bounded LRU caches), so repeated edits skip the
+# string building and hand sqlite3 an identical SQL text to hit its prepared-statement cache.
+@functools.lru_cache(maxsize=512)
+def _insert_sql(table_name, keys):
+    columns = ', '.join(f'"{k}"' for k in keys)
+    placeholders = ', '.join(['?'] * len(keys))
+    return f"INSERT INTO \"{table_name}\" ({columns}) VALUES ({placeholders})"
+
+@functools.lru_cache(maxsize=512)
+def _update_sql(table_name, set_keys, where_keys):
+    set_clause = ", ".join([f'"{k}" = ?' for k in set_keys])
+    where_clause = " AND ".join([f'"{k}" = ?' for k in where_keys])
+    return f'UPDATE "{table_name}" SET {set_clause} WHERE {where_clause}'
+
+@functools.lru_cache(maxsize=512)
+def _delete_sql(table_name, where_keys):
+    where_clause = " AND ".join([f'"{k}" = ?' for k in where_keys])
+    return f'DELETE FROM "{table_name}" WHERE {where_clause}'
+
+def _stream_batches(cursor, table_name, batch):
+    """
+    Yields a cursor's rows as lists of up to `batch` rows.
+    A read error partway through is re-raised, so consumers never mistake a cut-off stream for the whole table.
+    The cursor is closed once the rows run out.
+    """
     try:
-        cursor = conn.cursor()
-        cursor.execute(f'SELECT * FROM "{table_name}"')
-        headers = [desc[0] for desc in cursor.description]
-        rows = cursor.fetchall()
-        return headers, rows
+        while rows := cursor.fetchmany(batch):
+            yield rows
     except sqlite3.Error as e:
         print(f"Error fetching data for {table_name}: {e}")
-        return [], []
+        raise
     finally:
-        conn.close()
+        cursor.close()
+
+class RowStream:
+    """
+    An iterator over a table's rows (or batches of rows) that owns the cursor producing them.
+    An open cursor holds a read transaction on the thread's cached read-only connection, so later reads
+    on that thread would keep seeing the old data. Consumers that may stop early must therefore close
+    the stream, usually with `with stream:`, instead of leaving it to garbage collection.
+    """
+    __slots__ = ('_cursor', '_rows')
+
+    def __init__(self, cursor=None, rows=()):
+        self._cursor = cursor
+        self._rows = iter(rows)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._rows)
+
+    def close(self):
+        """Ends the stream and its read transaction. Safe to call more than once, or before reading."""
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor = None
+        close_rows = getattr(self._rows, 'close', None)
+        if close_rows:
+            close_rows()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _stream_rows(cursor, table_name, batch):
+    """Yields a cursor's rows, pulling them from SQLite one batch at a time."""
+    for rows in _stream_batches(cursor, table_name, batch):
+        yield from rows
+
+def get_table_cursor(db_name, table_name, arraysize=1000, limit=None, offset=0):
+    """
+    Returns an open cursor over SELECT * of a table on the read-only connection, or None on error.
+    Rows are stepped out of SQLite as the cursor is read, so nothing is materialized up front;
+    the caller owns the cursor and should close it when done.
+    limit/offset select a window of rows, e.g. one page of the data view.
+    """
+    conn = get_readonly_connection(db_name)
+    if not conn:
+        return None
+    cursor = conn.cursor()
+    cursor.arraysize = arraysize
+    try:
+        if limit is None:
+            cursor.execute(f'SELECT * FROM "{table_name}"')
+        else:
+            cursor.execute(f'SELECT * FROM "{table_name}" LIMIT ? OFFSET ?', (limit, offset))
+        return cursor
+    except sqlite3.Error as e:
+        print(f"Error fetching data for {table_name}: {e}")
+        cursor.close()
+        return None
+
+def iter_table_data(db_name, table_name, batch=1000, limit=None, offset=0):
+    """
+    Returns (headers, rows) for a given table, where rows is a RowStream that
+    fetches in batches, so the whole table never has to sit in memory at once.
+    limit/offset select a window of rows, e.g. one page of the data view.
+    Close rows when done with it (see RowStream).
+    """
+    cursor = get_table_cursor(db_name, table_name, batch, limit, offset)
+    if cursor is None:
+        return [], RowStream()
+    headers = [desc[0] for desc in cursor.description]
+    return headers, RowStream(cursor, _stream_rows(cursor, table_name, batch))
+
+def iter_table_batches(db_name, table_name, batch=10000):
+    """
+    Returns (headers, batches) for a given table, where batches is a RowStream yielding lists of rows.
+    Suited to bulk consumers such as csv.writer.writerows. Close batches when done with it.
+    """
+    cursor = get_table_cursor(db_name, table_name, batch)
+    if cursor is None:
+        return [], RowStream()
+    headers = [desc[0] for desc in cursor.description]
+    return headers, RowStream(cursor, _stream_batches(cursor, table_name, batch))
+
+def count_table_rows(db_name, table_name):
+    """Returns the number of rows in a table, or 0 if it can't be read."""
+    conn = get_readonly_connection(db_name)
+    if not conn:
+        return 0
+    try:
+        return conn.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()[0]
+    except sqlite3.Error as e:
+        print(f"Error counting rows of {table_name}: {e}")
+        return 0
+
+def get_table_data(db_name, table_name):
+    """Fetches all data and headers for a given table."""
+    headers, rows = iter_table_data(db_name, table_name)
+    with rows:
+        try:
+            return headers, list(rows)
+        except sqlite3.Error:
+            return [], [] # Already reported by _stream_batches
 
 def get_parent_table_values(db_name, table_name, column_name):
     """Fetches all distinct values from a parent table's column for FK selection."""
-    conn = get_db_connection(db_name)
+    conn = get_readonly_connection(db_name)
     if not conn:
         return []
     try:
@@ -518,8 +832,6 @@ def get_parent_table_values(db_name, table_name, column_name):
     except sqlite3.Error as e:
         print(f"Error fetching parent values: {e}")
         return []
-    finally:
-        conn.close()
 
 def insert_row(db_name, table_name, data_dict):
     """Inserts a new row of data into a table."""
@@ -527,9 +839,7 @@ def insert_row(db_name, table_name, data_dict):
     if not conn:
         return False, "Could not connect to the database."
 
-    columns = ', '.join(f'"{k}"' for k in data_dict.keys())
-    placeholders = ', '.join(['?'] * len(data_dict))
-    sql = f"INSERT INTO \"{table_name}\" ({columns}) VALUES ({placeholders})"
+    sql = _insert_sql(table_name, tuple(data_dict))
     
     try:
         cursor = conn.cursor()
@@ -537,9 +847,29 @@ def insert_row(db_name, table_name, data_dict):
         conn.commit()
         return True, "Row added successfully."
     except sqlite3.Error as e:
+        conn.rollback()
         return False, f"Failed to add row: {e}"
-    finally:
-        conn.close()
+
+def insert_rows_bulk(db_name, table_name, rows):
+    """
+    Inserts many rows (dicts sharing the same keys) in a single transaction.
+    One executemany and one commit instead of a commit per row.
+    """
+    if not rows:
+        return True, "No rows to add."
+    conn = get_db_connection(db_name)
+    if not conn:
+        return False, "Could not connect to the database."
+
+    keys = tuple(rows[0])
+    sql = _insert_sql(table_name, keys)
+
+    try:
+        with conn: # Commits on success, rolls back on error
+            conn.executemany(sql, ([row[k] for k in keys] for row in rows))
+        return True, f"{len(rows)} rows added successfully."
+    except sqlite3.Error as e:
+        return False, f"Failed to add rows: {e}"
 
 def update_row(db_name, table_name, pk_dict, new_data_dict):
     """Updates a row identified by its primary key."""
@@ -547,9 +877,7 @@ def update_row(db_name, table_name, pk_dict, new_data_dict):
     if not conn:
         return False, "Could not connect to the database."
 
-    set_clause = ", ".join([f'"{k}" = ?' for k in new_data_dict.keys()])
-    where_clause = " AND ".join([f'"{k}" = ?' for k in pk_dict.keys()])
-    sql = f'UPDATE "{table_name}" SET {set_clause} WHERE {where_clause}'
+    sql = _update_sql(table_name, tuple(new_data_dict), tuple(pk_dict))
     
     values = list(new_data_dict.values()) + list(pk_dict.values())
 
@@ -561,9 +889,8 @@ def update_row(db_name, table_name, pk_dict, new_data_dict):
             return False, "Row not found. It may have been deleted by another user."
         return True, "Row updated successfully."
     except sqlite3.Error as e:
+        conn.rollback()
         return False, f"Failed to update row: {e}"
-    finally:
-        conn.close()
 
 def delete_row(db_name, table_name, pk_dict):
     """Deletes a row identified by its primary key values."""
@@ -571,8 +898,7 @@ def delete_row(db_name, table_name, pk_dict):
     if not conn:
         return False, "Could not connect to the database."
     
-    where_clause = " AND ".join([f'"{k}" = ?' for k in pk_dict.keys()])
-    sql = f'DELETE FROM "{table_name}" WHERE {where_clause}'
+    sql = _delete_sql(table_name, tuple(pk_dict))
 
     try:
         cursor = conn.cursor()
@@ -582,6 +908,5 @@ def delete_row(db_name, table_name, pk_dict):
             return False, "Row not found. It may have been deleted by another user."
         return True, "Row deleted successfully."
     except sqlite3.Error as e:
+        conn.rollback()
         return False, f"Failed to delete row: {e}"
-    finally:
-        conn.close()
\ No newline at end of file
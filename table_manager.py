@@ -1,5 +1,7 @@
 import csv
+import os
 import json
+import operator
 from pathlib import Path
 from database_manager import DATABASES_ROOT_DIR
 from typing import Union
@@ -13,6 +15,9 @@ BOOLEAN = "Boolean"
 TEXT = "Text"
 DATA_TYPES = [PK, FK, DATE, INTEGER, BOOLEAN, TEXT]
 
+# Parsed meta.json schemas keyed by path, stored with the file's st_mtime_ns
+_meta_cache: dict[Path, tuple[int, dict]] = {}
+
 # --- Helper Functions ---
 def _get_db_path(db_name: str) -> Path:
     """Gets the path to a specific database directory."""
@@ -33,8 +38,12 @@ def list_tables(db_name: str) -> list[str]:
     db_path = _get_db_path(db_name)
     if not db_path.is_dir():
         return []
-    # The part of the filename before ".meta.json" is the table name
-    return sorted([p.name.replace('.meta.json', '') for p in db_path.glob("*.meta.json")])
+    # The part of the filename before ".meta.json" is the table name.
+    # os.scandir reuses the directory entry type, so no extra stat per file.
+    with os.scandir(db_path) as entries:
+        names = [e.name[:-10] for e in entries
+                 if e.name.endswith('.meta.json') and e.is_file(follow_symlinks=False)]
+    return sorted(names)
 
 def create_table(db_name: str, table_name: str, columns: list[dict]) -> tuple[bool, str]:
     """
@@ -76,6 +85,7 @@ def create_table(db_name: str, table_name: str, columns: list[dict]) -> tuple[bo
     try:
         with open(meta_path, 'w', encoding='utf-8') as f:
             json.dump(schema, f, indent=4)
+        _meta_cache.pop(meta_path, None)
 
         # Create CSV file with headers
         headers = [col['name'] for col in columns]
@@ -97,6 +107,7 @@ def delete_table(db_name: str, table_name: str) -> tuple[bool, str]:
 
     try:
         meta_path.unlink()
+        _meta_cache.pop(meta_path, None)
         if csv_path.exists():
             csv_path.unlink()
         return True, f"Table '{table_name}' deleted successfully."
@@ -104,38 +115,120 @@ def delete_table(db_name: str, table_name: str) -> tuple[bool, str]:
         return False, f"Error deleting table: {e}"
 
 def get_table_schema(db_name: str, table_name: str) -> Union[dict, None]:
-    """Reads and returns the schema for a table from its meta file."""
+    """
+    Reads and returns the schema for a table from its meta file.
+    The parsed schema is cached until the file's modification time changes.
+    """
     meta_path = _get_table_meta_path(db_name, table_name)
-    if not meta_path.exists():
+    try:
+        mtime = meta_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        _meta_cache.pop(meta_path, None)
         return None
+    cached = _meta_cache.get(meta_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
     with open(meta_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        schema = json.load(f)
+    _meta_cache[meta_path] = (mtime, schema)
+    return schema
 
-def get_table_data(db_name: str, table_name: str) -> Union[list[dict], None]:
-    """Reads a table's CSV and returns a list of dictionaries (rows)."""
+def get_table_data_columnar(db_name: str, table_name: str) -> Union[tuple[list[str], list[list[str]]], None]:
+    """
+    Reads a table's CSV column-wise and returns (headers, columns).
+    Each column is a plain list of values, so no dict is allocated per row.
+    """
     csv_path = _get_table_csv_path(db_name, table_name)
     if not csv_path.exists():
         return None
-    
-    data = []
+
     try:
         with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            columns = [[] for _ in headers]
+            width = len(headers)
             for row in reader:
-                data.append(row)
-        return data
+                if not row:
+                    continue # Blank lines are skipped, as csv.DictReader does
+                if len(row) < width:
+                    row += [None] * (width - len(row))
+                for column, value in zip(columns, row):
+                    column.append(value)
+        return headers, columns
     except Exception:
-        return [] # Return empty list on read error
+        return [], [] # Return an empty table on read error
+
+def get_table_rows(db_name: str, table_name: str) -> Union[tuple[list[str], list[list[str]]], None]:
+    """
+    Reads a table's CSV and returns (headers, rows), each row a plain list in header order.
+    Cheaper than building a dict per row when the caller only needs positional values.
+    """
+    csv_path = _get_table_csv_path(db_name, table_name)
+    if not csv_path.exists():
+        return None
+
+    try:
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            width = len(headers)
+            rows = [row if len(row) >= width else row + [None] * (width - len(row)) for row in reader if row]
+        return headers, rows
+    except Exception:
+        return [], [] # Return an empty table on read error
+
+def get_table_data(db_name: str, table_name: str) -> Union[list[dict], None]:
+    """Reads a table's CSV and returns a list of dictionaries (rows)."""
+    result = get_table_rows(db_name, table_name)
+    if result is None:
+        return None
+    headers, rows = result
+    return [dict(zip(headers, row)) for row in rows]
+
+def _ordered_rows(data: list[dict], headers: list[str]):
+    """
+    Yields each row's values in header order, the way csv.DictWriter would write them.
+    Rows holding exactly the header keys take an itemgetter fast path; others fill missing keys with ''.
+    """
+    width = len(headers)
+    getter = operator.itemgetter(*headers) if headers else None
+    for row in data:
+        if getter and len(row) == width:
+            try:
+                values = getter(row)
+            except KeyError:
+                pass
+            else:
+                yield values if width != 1 else (values,)
+                continue
+        extra = row.keys() - headers
+        if extra:
+            raise ValueError(f"dict contains fields not in fieldnames: {', '.join(map(repr, extra))}")
+        yield [row.get(h, '') for h in headers]
 
 def save_table_data(db_name: str, table_name: str, data: list[dict], headers: list[str]) -> tuple[bool, str]:
     """Overwrites the table's CSV file with new data."""
     csv_path = _get_table_csv_path(db_name, table_name)
     
     try:
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            writer.writerows(data)
+        with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            writer.writerows(_ordered_rows(data, headers))
+        return True, "Data saved successfully."
+    except Exception as e:
+        return False, f"Failed to save data: {e}"
+
+def save_table_data_columnar(db_name: str, table_name: str, headers: list[str], columns: list[list]) -> tuple[bool, str]:
+    """Overwrites the table's CSV file from column lists, as returned by get_table_data_columnar."""
+    csv_path = _get_table_csv_path(db_name, table_name)
+
+    try:
+        with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            writer.writerows(zip(*columns))
         return True, "Data saved successfully."
     except Exception as e:
-        return False, f"Failed to save data: {e}"
\ No newline at end of file
+        return False, f"Failed to save data: {e}"
@@ -3,30 +3,208 @@ from tkinter import ttk, messagebox, simpledialog
 from tkinter import filedialog
 import database_manager as dbm
 import csv
+import functools
+import gzip
+import io
+import itertools
+import os
+import queue
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+# Rows inserted into the data view per idle callback while a table loads
+ROW_INSERT_CHUNK = 500
+# Quiet time after the last table-list selection change before the table is loaded
+TABLE_SELECT_DELAY_MS = 120
+# Rows shown per page of the data view unless the user picks another size
+DEFAULT_PAGE_SIZE = 500
+# How often the Tk thread checks for finished worker jobs while any are running
+WORKER_POLL_MS = 20
+# Rows fetched from the cursor and handed to csv.writer.writerows per call during CSV export
+EXPORT_BATCH_ROWS = 4096
+# Encoded CSV is collected up to this many bytes before each write to the file descriptor
+EXPORT_FLUSH_BYTES = 1 << 20
+# O_BINARY keeps Windows from translating line endings on a raw descriptor; it is 0 elsewhere
+_EXPORT_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+# Largest CSV text (in characters) copied to the clipboard; bigger tables should be exported to a file
+CLIPBOARD_MAX_CHARS = 16 << 20
+
+# Declared column types that give SQLite's INTEGER or REAL affinity
+_NUMERIC_TYPE_MARKERS = ("INT", "REAL", "FLOA", "DOUB")
+_NUMBER_TYPES = {int, float}
+_NUMBER_OR_NULL_TYPES = {int, float, type(None)}
+
+def _is_numeric_table(db_name, table_name):
+    """True if every column is declared with a numeric type, making the CSV fast path worth trying."""
+    columns = dbm.get_table_columns(db_name, table_name)
+    return bool(columns) and all(
+        any(marker in (col['type'] or "").upper() for marker in _NUMERIC_TYPE_MARKERS) for col in columns
+    )
+
+def _write_all(fd, data):
+    """os.write in a loop, since a single call may write only part of the data."""
+    written = os.write(fd, data)
+    while written < len(data):
+        written += os.write(fd, data[written:])
+
+def _csv_text_chunks(headers, batches, numeric):
+    """Yields CSV text: the header row first, then one string per batch of rows."""
+    buf = io.StringIO(newline='')
+    writer = csv.writer(buf)
+    # Numbers and NULLs never need quoting, so their batches can skip csv's quote checks.
+    # A lone empty field must be quoted, so single-column tables keep the default writer.
+    plain_writer = csv.writer(buf, quoting=csv.QUOTE_NONE) if len(headers) > 1 else writer
+    writer.writerow(headers)
+    for batch in itertools.chain(((),), batches): # The empty first batch flushes out the header
+        # Declared types aren't enforced, so what a batch actually holds decides how it is written.
+        # Pure numbers are joined directly, exactly as csv.writer would write them
+        types = set(map(type, itertools.chain.from_iterable(batch))) if numeric else None
+        if types is not None and types <= _NUMBER_TYPES:
+            buf.writelines([",".join(map(str, row)) + "\r\n" for row in batch])
+        elif types is not None and types <= _NUMBER_OR_NULL_TYPES:
+            plain_writer.writerows(batch)
+        else:
+            writer.writerows(batch)
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+
+def _table_csv_text(db_name, table_name):
+    """
+    Opens a table for CSV formatting and returns (batches, chunks). batches is the dbm row stream,
+    which the caller closes when done (with batches: ...), even if it stops early or never reads;
+    chunks iterates the CSV text (see _csv_text_chunks), or is None if the table can't be read.
+    Rows are streamed from the cursor a batch at a time, so only one batch is formatted at once.
+    """
+    numeric = _is_numeric_table(db_name, table_name)
+    headers, batches = dbm.iter_table_batches(db_name, table_name, batch=EXPORT_BATCH_ROWS)
+    if not headers: # Every table has a column, so no headers means the query itself failed
+        return batches, None
+    return batches, _csv_text_chunks(headers, batches, numeric)
+
+# Failure kinds reported by the export helpers: the table couldn't be read, or the output couldn't be produced
+READ_FAILED = "read"
+WRITE_FAILED = "write"
+
+def _export_table_csv(db_name, table_name, filepath):
+    """
+    Streams a table's rows into a CSV file. Runs on a worker thread, so it touches no widgets.
+    Returns (failure, message), where failure is None on success, else READ_FAILED or WRITE_FAILED.
+    """
+    batches, chunks = _table_csv_text(db_name, table_name)
+    with batches:
+        if chunks is None:
+            return READ_FAILED, f"Could not read table '{table_name}'."
+        return _write_csv_chunks(table_name, chunks, filepath)
+
+def _write_csv_chunks(table_name, chunks, filepath):
+    """Writes the CSV text from _table_csv_text to filepath; returns (failure, message) like _export_table_csv."""
+    try:
+        # Each batch's text is encoded in one go, and the bytes go out in ~1 MiB writes: straight
+        # to the file descriptor, or through gzip (level 1, for throughput) when the path ends in .gz
+        chunk = bytearray()
+        if filepath.endswith('.gz'):
+            out = gzip.open(filepath, 'wb', compresslevel=1)
+            write, close = out.write, out.close
+        else:
+            fd = os.open(filepath, _EXPORT_OPEN_FLAGS, 0o666)
+            write, close = functools.partial(_write_all, fd), functools.partial(os.close, fd)
+        try:
+            for text in chunks:
+                chunk += text.encode('utf-8')
+                if len(chunk) >= EXPORT_FLUSH_BYTES:
+                    write(chunk)
+                    chunk.clear()
+            if chunk:
+                write(chunk)
+        finally:
+            close()
+        return None, f"Data from '{table_name}' successfully exported to:\n{filepath}"
+    except sqlite3.Error as e:
+        return READ_FAILED, f"Could not read table '{table_name}':\n{e}"
+    except (OSError, csv.Error) as e:
+        return WRITE_FAILED, f"An error occurred while exporting the file:\n{e}"
+
+def _table_csv_for_clipboard(db_name, table_name):
+    """
+    Formats a table as CSV text in memory, for the clipboard; no file is involved.
+    Returns (None, text), or (READ_FAILED, message) if the table can't be read and
+    (WRITE_FAILED, message) if the text can't be formatted or is too large to copy.
+    """
+    batches, chunks = _table_csv_text(db_name, table_name)
+    with batches: # Stops reading rows right away on every early return
+        if chunks is None:
+            return READ_FAILED, f"Could not read table '{table_name}'."
+        parts, size = [], 0
+        try:
+            for text in chunks:
+                size += len(text)
+                if size > CLIPBOARD_MAX_CHARS:
+                    return WRITE_FAILED, f"Table '{table_name}' is too large to copy to the clipboard. Export it to a file instead."
+                parts.append(text)
+        except sqlite3.Error as e:
+            return READ_FAILED, f"Could not read table '{table_name}':\n{e}"
+        except csv.Error as e:
+            return WRITE_FAILED, f"An error occurred while formatting the data:\n{e}"
+    return None, "".join(parts)
+
+@functools.lru_cache(maxsize=256)
+def _export_dialog_options(table_name):
+    """
+    The save dialog's options for exporting a table, built once per table name.
+    The default directory is fixed for the process, so it is part of the cached options.
+    """
+    default_path = os.path.join(dbm.get_default_export_dir(), f"{table_name}_export.csv")
+    return {
+        "defaultextension": ".csv",
+        "filetypes": (("CSV files", "*.csv"), ("Gzipped CSV files", "*.csv.gz"), ("All files", "*.*")),
+        "title": f"Export '{table_name}' to CSV",
+        "initialdir": os.path.dirname(default_path),
+        "initialfile": os.path.basename(default_path),
+    }
+
+def _clear_tree(tree):
+    """Removes every top-level item from a Treeview in one Tk command."""
+    children = tree.get_children()
+    if children:
+        tree.delete(*children)
 
 class ColumnDialog(simpledialog.Dialog):
     """A dialog for adding or editing a single column's definition."""
-    def __init__(self, parent, db_name, existing_column=None, all_column_names=None, add_mode=False):
+    def __init__(self, parent, db_name, existing_column=None, all_column_names=None, add_mode=False, table_names=None,
+                 existing_pk_name=None):
         self.db_name = db_name
+        self.table_names = table_names # Cached table list from the owning window, if it has one
         self.add_mode = add_mode # True if adding a column to an existing table
         # Names of other columns, to prevent PK conflicts
         self.other_column_names = [c['name'] for c in (all_column_names or []) if c['name'] != (existing_column or {}).get('name')]
         self.all_columns = all_column_names or []
-        self.column_data = existing_column or {}
+        self.column_data = cd = existing_column or {}
+        # Initial widget values, read from the column definition once
+        self._defaults = (
+            cd.get("name", ""), cd.get("type", "TEXT"), cd.get("pk", False), cd.get("autoincrement", False),
+            cd.get("not_null", False), cd.get("unique", False), cd.get("fk_table", ""), cd.get("fk_column", ""),
+        )
+        # existing_pk_name is the table's current Primary Key column, tracked by the caller
+        self._other_pk_exists = existing_pk_name is not None and existing_pk_name != cd.get('name')
         self.result = None
+        self._last_state = {} # Widget -> state last applied by update_states
+        self._updating = False
         title = "Edit Column" if existing_column else "Add New Column"
         super().__init__(parent, title)
 
     def body(self, master):
+        name, col_type, pk, autoincrement, not_null, unique, fk_table, fk_column = self._defaults
+
         # Column Name
         ttk.Label(master, text="Column Name:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
-        self.name_var = tk.StringVar(value=self.column_data.get("name", ""))
+        self.name_var = tk.StringVar(value=name)
         self.name_entry = ttk.Entry(master, textvariable=self.name_var)
         self.name_entry.grid(row=0, column=1, columnspan=2, sticky="ew", padx=5, pady=2)
 
         # Data Type
         ttk.Label(master, text="Data Type:").grid(row=1, column=0, sticky="w", padx=5, pady=2)
-        self.type_var = tk.StringVar(value=self.column_data.get("type", "TEXT"))
+        self.type_var = tk.StringVar(value=col_type)
         self.type_combo = ttk.Combobox(master, textvariable=self.type_var, state="readonly",
                                        values=["TEXT", "INTEGER", "REAL", "BLOB", "NUMERIC"])
         self.type_combo.bind("<<ComboboxSelected>>", self.update_states)
@@ -35,13 +213,13 @@ class ColumnDialog(simpledialog.Dialog):
         # Constraints
         constraints_frame = ttk.Frame(master)
         constraints_frame.grid(row=2, column=0, columnspan=3, sticky="w", pady=5)
-        self.pk_var = tk.BooleanVar(value=self.column_data.get("pk", False))
+        self.pk_var = tk.BooleanVar(value=pk)
         self.pk_check = ttk.Checkbutton(constraints_frame, text="Primary Key", variable=self.pk_var, command=self.update_states)
         self.pk_check.pack(side="left")
 
-        self.autoincrement_var = tk.BooleanVar(value=self.column_data.get("autoincrement", False))
-        self.not_null_var = tk.BooleanVar(value=self.column_data.get("not_null", False))
-        self.unique_var = tk.BooleanVar(value=self.column_data.get("unique", False))
+        self.autoincrement_var = tk.BooleanVar(value=autoincrement)
+        self.not_null_var = tk.BooleanVar(value=not_null)
+        self.unique_var = tk.BooleanVar(value=unique)
 
         self.autoincrement_check = ttk.Checkbutton(constraints_frame, text="Autoincrement", variable=self.autoincrement_var)
         self.autoincrement_check.pack(side="left", padx=5)
@@ -54,42 +232,60 @@ class ColumnDialog(simpledialog.Dialog):
         fk_frame = ttk.LabelFrame(master, text="Foreign Key Constraint", padding=5)
         fk_frame.grid(row=3, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
 
-        self.is_fk_var = tk.BooleanVar(value=bool(self.column_data.get("fk_table")))
+        self.is_fk_var = tk.BooleanVar(value=bool(fk_table))
         self.fk_check = ttk.Checkbutton(fk_frame, text="Is a Foreign Key", variable=self.is_fk_var, command=self.update_states)
         self.fk_check.grid(row=0, column=0, columnspan=2, sticky="w")
 
         self.fk_table_label = ttk.Label(fk_frame, text="References Table:")
         self.fk_table_label.grid(row=1, column=0, sticky="w", padx=5, pady=2)
-        self.fk_table_var = tk.StringVar(value=self.column_data.get("fk_table", ""))
+        self.fk_table_var = tk.StringVar(value=fk_table)
         self.fk_table_combo = ttk.Combobox(fk_frame, textvariable=self.fk_table_var, state="readonly")
         self.fk_table_combo.grid(row=1, column=1, sticky="ew", padx=5, pady=2)
-        self.fk_table_combo['values'] = dbm.list_tables(self.db_name)
+        self.fk_table_combo['values'] = self.table_names if self.table_names is not None else dbm.list_tables(self.db_name)
         self.fk_table_combo.bind("<<ComboboxSelected>>", self.on_fk_table_select)
 
         self.fk_column_label = ttk.Label(fk_frame, text="References Column:")
         self.fk_column_label.grid(row=2, column=0, sticky="w", padx=5, pady=2)
-        self.fk_column_var = tk.StringVar(value=self.column_data.get("fk_column", ""))
+        self.fk_column_var = tk.StringVar(value=fk_column)
         self.fk_column_combo = ttk.Combobox(fk_frame, textvariable=self.fk_column_var, state="disabled")
         self.fk_column_combo.grid(row=2, column=1, sticky="ew", padx=5, pady=2)
         self.fk_column_combo.bind("<<ComboboxSelected>>", self.on_fk_column_select)
 
         fk_frame.columnconfigure(1, weight=1)
-        self.update_states() # Set initial state of all widgets
 
         # If in "add column" mode, disable unsupported options
         if self.add_mode:
-            self.pk_check.config(state="disabled")
             self.pk_var.set(False)
             self.fk_check.config(state="disabled")
             self.is_fk_var.set(False)
-            self.update_states() # Run again to reflect disabled PK/FK
+        self.update_states() # Set initial state of all widgets
 
         if self.fk_table_var.get(): self.on_fk_table_select() # Populate columns if editing
 
         return self.name_entry
 
+    def _set_state(self, widget, state):
+        """Applies a widget state only if it differs from the one last applied."""
+        if self._last_state.get(widget) != state:
+            widget.config(state=state)
+            self._last_state[widget] = state
+
+    @staticmethod
+    def _set_var(var, value):
+        if var.get() != value:
+            var.set(value)
+
     def update_states(self, event=None):
         """Central function to manage the state of all widgets based on user selections."""
+        if self._updating:
+            return
+        self._updating = True
+        try:
+            self._apply_states()
+        finally:
+            self._updating = False
+
+    def _apply_states(self):
         is_fk = self.is_fk_var.get()
         is_pk = self.pk_var.get()
         is_integer = self.type_var.get() == "INTEGER"
@@ -97,49 +293,50 @@ class ColumnDialog(simpledialog.Dialog):
         # --- Foreign Key has top priority ---
         if is_fk:
             # If it's a foreign key, most other attributes are inherited or irrelevant
-            self.pk_var.set(False)
-            self.pk_check.config(state="disabled")
-            self.autoincrement_check.config(state="disabled")
-            self.not_null_check.config(state="disabled")
-            self.unique_check.config(state="disabled")
-            self.type_combo.config(state="disabled")
-            self.fk_table_combo.config(state="readonly")
-            self.fk_column_combo.config(state="readonly" if self.fk_column_combo['values'] else "disabled")
+            self._set_var(self.pk_var, False)
+            self._set_state(self.pk_check, "disabled")
+            self._set_state(self.autoincrement_check, "disabled")
+            self._set_state(self.not_null_check, "disabled")
+            self._set_state(self.unique_check, "disabled")
+            self._set_state(self.type_combo, "disabled")
+            self._set_state(self.fk_table_combo, "readonly")
+            self._set_state(self.fk_column_combo, "readonly" if self.fk_column_combo['values'] else "disabled")
             return
 
         # --- If not a Foreign Key, manage Primary Key and other constraints ---
-        self.pk_check.config(state="normal")
-        self.type_combo.config(state="readonly")
-        self.fk_table_combo.config(state="disabled")
-        self.fk_column_combo.config(state="disabled")
+        # A column added to an existing table can't become the Primary Key
+        self._set_state(self.pk_check, "disabled" if self.add_mode else "normal")
+        self._set_state(self.type_combo, "readonly")
+        self._set_state(self.fk_table_combo, "disabled")
+        self._set_state(self.fk_column_combo, "disabled")
 
         if is_pk:
-            self.not_null_var.set(True)
-            self.unique_var.set(True) # A PK is implicitly unique
-            self.not_null_check.config(state="disabled")
-            self.unique_check.config(state="disabled")
+            self._set_var(self.not_null_var, True)
+            self._set_var(self.unique_var, True) # A PK is implicitly unique
+            self._set_state(self.not_null_check, "disabled")
+            self._set_state(self.unique_check, "disabled")
         else:
-            self.not_null_check.config(state="normal")
-            self.unique_check.config(state="normal")
+            self._set_state(self.not_null_check, "normal")
+            self._set_state(self.unique_check, "normal")
 
         # Autoincrement is only available for an INTEGER PRIMARY KEY
         if is_pk and is_integer:
-            self.autoincrement_check.config(state="normal")
+            self._set_state(self.autoincrement_check, "normal")
         else:
-            self.autoincrement_var.set(False)
-            self.autoincrement_check.config(state="disabled")
+            self._set_var(self.autoincrement_var, False)
+            self._set_state(self.autoincrement_check, "disabled")
 
     def on_fk_table_select(self, event=None):
         table = self.fk_table_var.get()
         valid_cols = dbm.get_valid_fk_target_columns(self.db_name, table)
         self.fk_column_combo['values'] = valid_cols
         if valid_cols:
-            self.fk_column_combo.config(state="readonly")
+            self._set_state(self.fk_column_combo, "readonly")
             self.fk_column_combo.set(valid_cols[0])
             self.on_fk_column_select() # Auto-select type
         else:
             self.fk_column_combo.set("")
-            self.fk_column_combo.config(state="disabled")
+            self._set_state(self.fk_column_combo, "disabled")
             messagebox.showwarning("No Valid Columns", f"Table '{table}' has no PRIMARY KEY or UNIQUE columns to reference.", parent=self)
 
     def on_fk_column_select(self, event=None):
@@ -167,7 +364,7 @@ class ColumnDialog(simpledialog.Dialog):
             self.result = None
             return
 
-        if self.pk_var.get() and any(c.get('pk') for c in self.all_columns if c.get('name') != self.column_data.get('name')):
+        if self.pk_var.get() and self._other_pk_exists:
              messagebox.showerror("Invalid Constraint", "Another column is already the Primary Key. A table can only have one Primary Key.", parent=self)
              self.result = None
              return
@@ -183,10 +380,14 @@ class ColumnDialog(simpledialog.Dialog):
             "fk_column": self.fk_column_var.get() if self.is_fk_var.get() else None,
         }
 
+# Column flags and the short tags CreateTableDialog lists them with, in display order
+_CONSTRAINT_FLAGS = (('pk', 'PK'), ('autoincrement', 'AI'), ('not_null', 'NN'), ('unique', 'UQ'))
+
 class CreateTableDialog(simpledialog.Dialog):
     """Dialog to define a new table, including its name and columns."""
-    def __init__(self, parent, db_name):
+    def __init__(self, parent, db_name, table_names=None):
         self.db_name = db_name
+        self.table_names = table_names
         # Start with a default primary key column
         self.columns = [{
             "name": "ID", "type": "INTEGER",
@@ -194,11 +395,11 @@ class CreateTableDialog(simpledialog.Dialog):
             "not_null": True, "unique": True,
             "fk_table": None, "fk_column": None
         }]
+        self._pk_name = "ID" # Name of the Primary Key column, kept up to date on every change
         self.result = None
         super().__init__(parent, "Create New Table")
 
     def body(self, master):
-        self.geometry("600x400")
         # Table Name
         name_frame = ttk.Frame(master)
         name_frame.pack(fill="x", padx=5, pady=5)
@@ -228,44 +429,68 @@ class CreateTableDialog(simpledialog.Dialog):
         self.refresh_tree()
         return self.table_name_entry
 
+    def buttonbox(self):
+        super().buttonbox()
+        # Size the dialog once every widget is packed, while it is still withdrawn
+        self.geometry("600x400")
+
+    def _column_display(self, col):
+        """Returns the (text, values) a column definition is shown with in the tree."""
+        constraints = [tag for key, tag in _CONSTRAINT_FLAGS if col.get(key)]
+        if col.get('fk_table'): constraints.append(f"FK->{col['fk_table']}({col['fk_column']})")
+        display_name = f"{col['name']} (PK)" if col.get('pk') else col['name']
+        return display_name, (col['type'], ", ".join(constraints))
+
+    def _insert_column_row(self, col):
+        # Stable string iids, kept parallel to self.columns, so removing a row needs no re-numbering
+        iid = f"col_{next(self._iid_counter)}"
+        self._iids.append(iid)
+        text, values = self._column_display(col)
+        self.tree.insert("", "end", iid=iid, text=text, values=values)
+
     def refresh_tree(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        for i, col in enumerate(self.columns):
-            display_name = col['name']
-            constraints = []
-            if col.get('pk'):
-                constraints.append("PK")
-                display_name = f"{col['name']} (PK)"
-            if col.get('autoincrement'): constraints.append("AI")
-            if col.get('not_null'): constraints.append("NN")
-            if col.get('unique'): constraints.append("UQ")
-            if col.get('fk_table'): constraints.append(f"FK->{col['fk_table']}({col['fk_column']})")
-            self.tree.insert("", "end", iid=i, text=display_name, values=(col['type'], ", ".join(constraints)))
+        """Rebuilds the whole tree; individual edits update their row directly."""
+        _clear_tree(self.tree)
+        self._iids = []
+        self._iid_counter = itertools.count()
+        for col in self.columns:
+            self._insert_column_row(col)
 
     def add_column(self):
-        dialog = ColumnDialog(self, self.db_name, all_column_names=self.columns)
+        dialog = ColumnDialog(self, self.db_name, all_column_names=self.columns, table_names=self.table_names,
+                              existing_pk_name=self._pk_name)
         if dialog.result:
+            if dialog.result['pk']:
+                self._pk_name = dialog.result['name']
             self.columns.append(dialog.result)
-            self.refresh_tree()
+            self._insert_column_row(dialog.result)
 
     def edit_column(self):
         selected = self.tree.focus()
         if not selected:
             return
-        col_index = int(selected)
-        dialog = ColumnDialog(self, self.db_name, existing_column=self.columns[col_index], all_column_names=self.columns)
+        col_index = self._iids.index(selected)
+        dialog = ColumnDialog(self, self.db_name, existing_column=self.columns[col_index], all_column_names=self.columns,
+                              table_names=self.table_names, existing_pk_name=self._pk_name)
         if dialog.result:
+            if dialog.result['pk']:
+                self._pk_name = dialog.result['name']
+            elif self.columns[col_index].get('pk'):
+                self._pk_name = None
             self.columns[col_index] = dialog.result
-            self.refresh_tree()
+            text, values = self._column_display(dialog.result)
+            self.tree.item(selected, text=text, values=values)
 
     def remove_column(self):
         selected = self.tree.focus()
         if not selected:
             return
         if messagebox.askyesno("Confirm", "Remove selected column definition?", parent=self):
-            self.columns.pop(int(selected))
-            self.refresh_tree()
+            col_index = self._iids.index(selected)
+            if self.columns.pop(col_index).get('pk'):
+                self._pk_name = None
+            self._iids.pop(col_index)
+            self.tree.delete(selected)
 
     def apply(self):
         table_name = self.table_name_var.get().strip()
@@ -281,19 +506,24 @@ class CreateTableDialog(simpledialog.Dialog):
 
 class RowDataDialog(simpledialog.Dialog):
     """Dialog to add or edit a row in a table."""
-    def __init__(self, parent, db_name, table_name, initial_data=None):
+    def __init__(self, parent, db_name, table_name, initial_data=None, schema=None):
         self.db_name = db_name
         self.table_name = table_name
+        self.schema = schema # Cached schema entry from the owning window, if it has one
         self.initial_data = initial_data or {}
         self.widgets = {}
+        self._fk_values_cache = {} # (parent table, parent column) -> values, filled on first dropdown
         self.result = None
         title = f"Edit Row in '{table_name}'" if initial_data else f"Add Row to '{table_name}'"
         super().__init__(parent, title)
 
     def body(self, master):
-        self.columns = dbm.get_table_columns(self.db_name, self.table_name)
-        self.fk_info = dbm.get_foreign_key_info(self.db_name, self.table_name)
-        self.pk_names = dbm.get_primary_key_columns(self.db_name, self.table_name)
+        if self.schema:
+            self.columns, self.fk_info, self.pk_names = self.schema['columns'], self.schema['fk_info'], self.schema['pk_names']
+        else:
+            self.columns = dbm.get_table_columns(self.db_name, self.table_name)
+            self.fk_info = dbm.get_foreign_key_info(self.db_name, self.table_name)
+            self.pk_names = dbm.get_primary_key_columns(self.db_name, self.table_name)
         
         # Check for autoincrement PK for "add" mode
         is_autoincrement_add_mode = (
@@ -313,13 +543,14 @@ class RowDataDialog(simpledialog.Dialog):
 
             ttk.Label(master, text=f"{col_name}:").grid(row=i, column=0, sticky="w", padx=5, pady=2)
             
-            # If it's a foreign key, use a Combobox
+            # If it's a foreign key, use a Combobox whose choices are only loaded when it is opened
             if col_name in self.fk_info:
                 fk = self.fk_info[col_name]
-                parent_values = dbm.get_parent_table_values(self.db_name, fk['table'], fk['to'])
-                combo = ttk.Combobox(master, state="readonly", values=parent_values)
-                if self.initial_data.get(col_name) in parent_values:
-                    combo.set(self.initial_data.get(col_name))
+                current = self.initial_data.get(col_name, "")
+                combo = ttk.Combobox(master, state="readonly", values=[current] if current != "" else [])
+                combo.configure(postcommand=lambda c=combo, fk=fk: self._load_fk_values(c, fk))
+                if current != "":
+                    combo.set(current)
                 combo.grid(row=i, column=1, sticky="ew", padx=5, pady=2)
                 self.widgets[col_name] = combo
             else: # Otherwise, use a standard Entry
@@ -337,6 +568,14 @@ class RowDataDialog(simpledialog.Dialog):
         if self.widgets:
             return self.widgets.get(next(iter(self.widgets.keys())), None)
 
+    def _load_fk_values(self, combo, fk):
+        """Fills an FK combobox with the parent column's values just before its list opens."""
+        key = (fk['table'], fk['to'])
+        values = self._fk_values_cache.get(key)
+        if values is None:
+            values = self._fk_values_cache[key] = dbm.get_parent_table_values(self.db_name, fk['table'], fk['to'])
+        combo['values'] = values
+
     def apply(self):
         data = {}
         for col_name, widget in self.widgets.items():
@@ -353,20 +592,44 @@ class RowDataDialog(simpledialog.Dialog):
 class TableManagerWindow(tk.Toplevel):
     def __init__(self, parent, db_name):
         super().__init__(parent)
+        self.withdraw() # Stay hidden while the widgets are built, then show at the final size
         self.db_name = db_name
+        # Schema lookups per table and the table list, kept until this window changes the schema
+        self._schema_cache = {}
+        self._table_names = None
+        self._row_load_job = None # Pending after_idle job inserting the next chunk of rows
+        self._data_table = None # Table whose rows the data view holds; None when it needs (re)loading
+        self._page_table = None # Table the current page number belongs to
+        self._page = 0
+        # Columns of the loaded page and each one's position in a row's values
+        self._headers = ()
+        self._header_index = {}
+        self._tree_headers = () # Columns the Treeview is currently configured with
+        self._select_after_id = None # Pending debounced on_table_select
+        self._active_table = None # Table selected in the list, as of the last on_table_select
+        self._delete_btn_update_pending = False
+        self._export_in_flight = False
+        # All dbm work for this window runs on one worker thread (with its own cached
+        # connections), so queries run in order and never block the Tk main loop.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dbm-table")
+        self._pending = 0 # Jobs submitted but not yet finished
+        # The worker only queues finished jobs; they are picked up on the Tk thread by _poll_worker
+        self._finished_jobs = queue.SimpleQueue()
+        self._poll_after_id = None
+        self._write_in_flight = False
+        self._closed = False
+        self._structure_token = 0 # Bumped per structure load so stale results are dropped
+        self._data_token = 0 # Same for data loads
         self.title(f"Table Manager - {db_name}")
-        self.geometry("800x600")
-        self.transient(parent)
-        self.grab_set()
 
         paned_window = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
         paned_window.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Left Pane: Table List
         left_frame = ttk.LabelFrame(paned_window, text="Tables", padding=5)
-        self.table_list = tk.Listbox(left_frame)
+        self.table_list = tk.Listbox(left_frame, selectmode=tk.EXTENDED) # Several tables can be deleted at once
         self.table_list.pack(fill="both", expand=True)
-        self.table_list.bind("<<ListboxSelect>>", self.on_table_select)
+        self.table_list.bind("<<ListboxSelect>>", self._on_table_list_select)
         paned_window.add(left_frame, weight=1)
 
         btn_frame = ttk.Frame(left_frame)
@@ -374,13 +637,18 @@ class TableManagerWindow(tk.Toplevel):
         ttk.Button(btn_frame, text="Create Table...", command=self.create_table).pack(side="left", fill="x", expand=True, padx=(0,2))
         self.delete_btn = ttk.Button(btn_frame, text="Delete Table", state="disabled", command=self.delete_table)
         self.delete_btn.pack(side="left", fill="x", expand=True, padx=(2,0))
+        # Shown under the buttons only while a change (create/drop/alter/row edit) runs on the worker
+        self._write_progress = ttk.Progressbar(left_frame, mode="indeterminate")
+        self._write_progress_shown = False
 
         # Right Pane: Notebook with Structure and Data tabs
-        notebook = ttk.Notebook(paned_window)
+        self.notebook = notebook = ttk.Notebook(paned_window)
         paned_window.add(notebook, weight=3)
+        # The Data tab is only filled when it is shown
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # -- Structure Tab --
-        structure_tab = ttk.Frame(notebook, padding=5)
+        self.structure_tab = structure_tab = ttk.Frame(notebook, padding=5)
         notebook.add(structure_tab, text="Structure")
         
         self.details_tree = ttk.Treeview(structure_tab, columns=("Name", "Type", "NotNull", "PK", "Unique", "ForeignKey"), show="headings")
@@ -409,7 +677,7 @@ class TableManagerWindow(tk.Toplevel):
         self.remove_column_btn.pack(side="left")
 
         # -- Data Tab --
-        data_tab = ttk.Frame(notebook, padding=5)
+        self.data_tab = data_tab = ttk.Frame(notebook, padding=5)
         notebook.add(data_tab, text="Data")
 
         data_btn_frame = ttk.Frame(data_tab)
@@ -419,7 +687,30 @@ class TableManagerWindow(tk.Toplevel):
         self.delete_row_btn = ttk.Button(data_btn_frame, text="Delete Selected Row", command=self.delete_row, state="disabled")
         self.delete_row_btn.pack(side="left", padx=(0, 5))
         self.export_csv_btn = ttk.Button(data_btn_frame, text="Export to CSV...", command=self.export_to_csv, state="disabled")
-        self.export_csv_btn.pack(side="left")
+        self.export_csv_btn.pack(side="left", padx=(0, 5))
+        self.copy_csv_btn = ttk.Button(data_btn_frame, text="Copy as CSV", command=self.copy_to_clipboard, state="disabled")
+        self.copy_csv_btn.pack(side="left")
+
+        # Buttons that only need a table to be selected; they all start disabled
+        self._selection_buttons = (self.delete_btn, self.add_row_btn, self.add_column_btn, self.export_csv_btn,
+                                   self.copy_csv_btn)
+        self._selection_buttons_state = "disabled"
+
+        # Pagination: only one page of rows is held in the Treeview at a time
+        page_frame = ttk.Frame(data_tab)
+        page_frame.pack(fill="x", pady=(0, 5))
+        ttk.Button(page_frame, text="<<", width=3, command=lambda: self._go_to_page(0)).pack(side="left")
+        ttk.Button(page_frame, text="<", width=3, command=lambda: self._go_to_page(max(0, self._page - 1))).pack(side="left", padx=(2, 0))
+        self.page_label = ttk.Label(page_frame, text="Page 1 of 1")
+        self.page_label.pack(side="left", padx=5)
+        ttk.Button(page_frame, text=">", width=3, command=lambda: self._go_to_page(self._page + 1)).pack(side="left")
+        ttk.Button(page_frame, text=">>", width=3, command=lambda: self._go_to_page(-1)).pack(side="left", padx=(2, 0))
+        self.page_size_var = tk.IntVar(value=DEFAULT_PAGE_SIZE)
+        page_size_spin = ttk.Spinbox(page_frame, from_=100, to=10000, increment=100, width=6,
+                                     textvariable=self.page_size_var, command=lambda: self._go_to_page(0))
+        page_size_spin.bind("<Return>", lambda e: self._go_to_page(0))
+        page_size_spin.pack(side="right")
+        ttk.Label(page_frame, text="Rows per page:").pack(side="right", padx=(0, 5))
 
         self.data_tree = ttk.Treeview(data_tab, show="headings")
         # Bind double-click to edit row
@@ -433,43 +724,238 @@ class TableManagerWindow(tk.Toplevel):
         data_h_scroll.pack(side="bottom", fill="x")
         self.data_tree.pack(fill="both", expand=True)
 
+        self.wm_geometry("800x600")
+        self.transient(parent)
+        self.deiconify()
+        self.grab_set() # Needs the window to be viewable
         self.refresh_table_list()
 
+    def _get_table_names(self):
+        """Returns the database's table names, querying only after an invalidation."""
+        if self._table_names is None:
+            self._table_names = dbm.list_tables(self.db_name)
+        return self._table_names
+
+    def _load_schema(self, table_name):
+        """Runs the schema lookups for a table; safe to call from the worker thread."""
+        return {
+            'full_def': dbm.get_full_table_definition(self.db_name, table_name),
+            'columns': dbm.get_table_columns(self.db_name, table_name),
+            'fk_info': dbm.get_foreign_key_info(self.db_name, table_name),
+            'pk_names': dbm.get_primary_key_columns(self.db_name, table_name),
+        }
+
+    def _get_schema(self, table_name):
+        """Returns the cached schema lookups for a table, loading them on first use."""
+        schema = self._schema_cache.get(table_name)
+        if schema is None:
+            schema = self._schema_cache[table_name] = self._load_schema(table_name)
+        return schema
+
+    def _invalidate_schema(self, table_name=None):
+        """Drops one table's cached schema, or everything (including the table list) when no table is given."""
+        if table_name is None:
+            self._schema_cache.clear()
+            self._table_names = None
+        else:
+            self._schema_cache.pop(table_name, None)
+
+    def destroy(self):
+        self._closed = True
+        for job in (self._row_load_job, self._select_after_id, self._poll_after_id):
+            if job is not None:
+                self.after_cancel(job)
+        self._row_load_job = self._select_after_id = self._poll_after_id = None
+        # Let the worker close its own connections once queued work is done
+        self._executor.submit(dbm.close_thread_connections, self.db_name)
+        self._executor.shutdown(wait=False)
+        super().destroy()
+
+    # --- Background work ---
+    def _submit(self, func, *args, on_done=None, on_error=None, write=False):
+        """
+        Runs func(*args) on the window's worker thread and hands the result to on_done
+        on the Tk thread. write=True marks a change, blocking other changes until it finishes.
+        If func raises, the error is shown and on_error (if given) is called instead.
+        """
+        self._pending += 1
+        if write:
+            self._write_in_flight = True
+        self._update_busy_indicator()
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(lambda f: self._finished_jobs.put((f, on_done, on_error, write)))
+        if self._poll_after_id is None:
+            self._poll_after_id = self.after(WORKER_POLL_MS, self._poll_worker)
+
+    def _poll_worker(self):
+        """Finishes the jobs the worker has completed, and keeps polling while others are outstanding."""
+        self._poll_after_id = None
+        while not self._closed:
+            try:
+                job = self._finished_jobs.get_nowait()
+            except queue.Empty:
+                break
+            self._finish(*job)
+        # A callback may have submitted more work, which already restarted the polling
+        if self._pending and not self._closed and self._poll_after_id is None:
+            self._poll_after_id = self.after(WORKER_POLL_MS, self._poll_worker)
+
+    def _finish(self, future, on_done, on_error, write):
+        if self._closed:
+            return
+        self._pending -= 1
+        if write:
+            self._write_in_flight = False
+        self._update_busy_indicator()
+        try:
+            result = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"An unexpected error occurred:\n{e}", parent=self)
+            if on_error:
+                on_error()
+            return
+        if on_done:
+            on_done(result)
+
+    def _update_busy_indicator(self):
+        """Marks the tab headers with an ellipsis while work is in flight, and shows the progress bar during changes."""
+        suffix = " \u2026" if self._pending else ""
+        self.notebook.tab(self.structure_tab, text="Structure" + suffix)
+        self.notebook.tab(self.data_tab, text="Data" + suffix)
+        if self._write_in_flight != self._write_progress_shown:
+            self._write_progress_shown = self._write_in_flight
+            if self._write_in_flight:
+                self._write_progress.pack(fill="x")
+                self._write_progress.start(15)
+            else:
+                self._write_progress.stop()
+                self._write_progress.pack_forget()
+
     def refresh_table_list(self):
+        if self._table_names is None:
+            self._submit(dbm.list_tables, self.db_name, on_done=self._on_table_names_loaded)
+        else:
+            self._show_table_names()
+
+    def _on_table_names_loaded(self, table_names):
+        self._table_names = table_names
+        self._show_table_names()
+
+    def _show_table_names(self):
         self.table_list.delete(0, tk.END)
-        for table in dbm.list_tables(self.db_name):
+        for table in self._table_names:
             self.table_list.insert(tk.END, table)
         self.on_table_select()
 
-    def on_table_select(self, event=None):
-        # Clear both views
-        for i in self.details_tree.get_children(): self.details_tree.delete(i)
-        for i in self.data_tree.get_children(): self.data_tree.delete(i)
-        self.data_tree.unbind("<B1>") # Clear old header sort bindings
-        self.data_tree["columns"] = []
+    def _on_table_list_select(self, event=None):
+        """Debounces selection changes so only the table the user settles on gets loaded."""
+        if self._select_after_id is not None:
+            self.after_cancel(self._select_after_id)
+            self._select_after_id = None
+        selection = self.table_list.curselection()
+        if (self.table_list.get(selection[0]) if selection else None) == self._active_table:
+            return # Back on (or re-clicked) the table already shown
+        self._select_after_id = self.after(TABLE_SELECT_DELAY_MS, self._do_on_table_select)
+
+    def _do_on_table_select(self):
+        self._select_after_id = None
+        self.on_table_select()
+
+    def _schedule_delete_btn_update(self, event=None):
+        """Coalesces bursts of <<TreeviewSelect>> into one button update per idle cycle."""
+        if not self._delete_btn_update_pending:
+            self._delete_btn_update_pending = True
+            self.after_idle(self._flush_delete_btn_update)
+
+    def _flush_delete_btn_update(self):
+        self._delete_btn_update_pending = False
+        self.delete_row_btn.config(state="normal")
+
+    def on_table_select(self, event=None, on_rows_loaded=None, page=None):
+        """
+        Refreshes the Structure tab for the selected table, and the Data tab if it is showing.
+        on_rows_loaded, if given, is called once every row of the page is in the data view;
+        page picks the page to show (-1 for the last one) instead of staying on the current page.
+        """
+        self._clear_data_view()
+        self._structure_token += 1 # Drop any structure still being loaded
+        _clear_tree(self.details_tree)
 
         selection = self.table_list.curselection()
         data_tree_selection = self.data_tree.selection()
+        self._active_table = self.table_list.get(selection[0]) if selection else None
+
+        state = "normal" if selection else "disabled"
+        if state != self._selection_buttons_state:
+            self._selection_buttons_state = state
+            for button in self._selection_buttons:
+                button.config(state=state)
 
         if not selection:
-            self.delete_btn.config(state="disabled")
-            self.add_row_btn.config(state="disabled")
-            self.add_column_btn.config(state="disabled")
             self.remove_column_btn.config(state="disabled")
-            self.export_csv_btn.config(state="disabled")
             self.delete_row_btn.config(state="disabled")
             return
 
-        self.delete_btn.config(state="normal")
-        self.add_row_btn.config(state="normal")
-        self.add_column_btn.config(state="normal")
-        self.export_csv_btn.config(state="normal")
         self.on_structure_select() # Set initial state for remove button
         self.delete_row_btn.config(state="normal" if data_tree_selection else "disabled")
-        table_name = self.table_list.get(selection[0])
+        table_name = self._active_table
+
+        if table_name in self._schema_cache:
+            self._populate_structure(table_name)
+        else:
+            token = self._structure_token
+            self._submit(self._load_schema, table_name,
+                         on_done=lambda schema: self._on_schema_loaded(token, table_name, schema))
+        if self._data_tab_showing():
+            self._populate_data(table_name, on_rows_loaded, page)
         
-        # --- Populate Structure Tab ---
-        columns = dbm.get_full_table_definition(self.db_name, table_name)
+        # Update delete button state based on data tree selection
+        self.data_tree.bind("<<TreeviewSelect>>", self._schedule_delete_btn_update)
+        self.details_tree.bind("<<TreeviewSelect>>", self.on_structure_select)
+
+    def _on_tab_changed(self, event=None):
+        """Loads the selected table's rows the first time the Data tab is shown for it."""
+        if not self._data_tab_showing():
+            return
+        table_name = self._active_table
+        if table_name is not None and table_name != self._data_table:
+            self._populate_data(table_name)
+
+    def _go_to_page(self, page):
+        if self._active_table is not None:
+            self._populate_data(self._active_table, page=page)
+
+    def _page_size(self):
+        try:
+            return max(1, int(self.page_size_var.get()))
+        except (tk.TclError, ValueError):
+            self.page_size_var.set(DEFAULT_PAGE_SIZE)
+            return DEFAULT_PAGE_SIZE
+
+    def _data_tab_showing(self):
+        return str(self.notebook.select()) == str(self.data_tab)
+
+    def _clear_data_view(self):
+        """Empties the data view and marks it as needing a reload."""
+        # Stop filling in rows of the previously shown table
+        if self._row_load_job is not None:
+            self.after_cancel(self._row_load_job)
+            self._row_load_job = None
+        self._data_table = None
+        self._data_token += 1 # Drop any page still being fetched
+        _clear_tree(self.data_tree)
+        self.data_tree.unbind("<B1>") # Clear old header sort bindings
+        # Hide the columns rather than dropping them, so the next page can reuse them
+        self.data_tree.configure(displaycolumns=())
+        self._headers, self._header_index = (), {}
+
+    def _on_schema_loaded(self, token, table_name, schema):
+        self._schema_cache[table_name] = schema
+        if token == self._structure_token: # Still the table being shown
+            self._populate_structure(table_name)
+
+    def _populate_structure(self, table_name):
+        columns = self._get_schema(table_name)['full_def']
         for col in columns:
             pk_val = '✔' if col.get('pk') else ''
             not_null_val = '✔' if col.get('not_null') else ''
@@ -486,62 +972,117 @@ class TableManagerWindow(tk.Toplevel):
             # The 'text' property is kept for compatibility with the 'remove column' logic
             self.details_tree.insert("", "end", values=values, text=col['name'])
 
-        # --- Populate Data Tab ---
-        headers, rows = dbm.get_table_data(self.db_name, table_name)
-        self.data_tree["columns"] = headers
-        for header in headers:
-            self.data_tree.heading(header, text=header)
-            self.data_tree.column(header, width=100, stretch=tk.YES)
-        
-        for row in rows:
-            self.data_tree.insert("", "end", values=row)
-        
-        # Update delete button state based on data tree selection
-        self.data_tree.bind("<<TreeviewSelect>>", lambda e: self.delete_row_btn.config(state="normal"))
-        self.details_tree.bind("<<TreeviewSelect>>", self.on_structure_select)
+    def _populate_data(self, table_name, on_rows_loaded=None, page=None):
+        """Shows one page of the table's rows; page defaults to the current page (the first for a new table)."""
+        self._clear_data_view()
+        self._data_table = table_name
+
+        if page is None:
+            page = self._page if table_name == self._page_table else 0
+        token = self._data_token
+        self._submit(self._fetch_page, table_name, page, self._page_size(),
+                     on_done=lambda result: self._on_page_loaded(token, table_name, result, on_rows_loaded))
+
+    def _fetch_page(self, table_name, page, page_size):
+        """Reads one page of rows on the worker thread; returns (page, page_count, offset, headers, rows)."""
+        page_count = max(1, -(-dbm.count_table_rows(self.db_name, table_name) // page_size))
+        if page < 0 or page >= page_count: # -1 asks for the last page
+            page = page_count - 1
+        offset = page * page_size
+        headers, rows = dbm.iter_table_data(self.db_name, table_name, limit=page_size, offset=offset)
+        with rows:
+            return page, page_count, offset, headers, list(rows)
+
+    def _on_page_loaded(self, token, table_name, result, on_rows_loaded):
+        if token != self._data_token:
+            return # The view was cleared or another page was requested meanwhile
+        page, page_count, offset, headers, rows = result
+        self._page, self._page_table = page, table_name
+        self.page_label.config(text=f"Page {page + 1} of {page_count}")
+
+        # Hide the columns while the first rows go in so Tk lays the view out once
+        self.data_tree.configure(displaycolumns=())
+        self._headers = tuple(headers)
+        self._header_index = {h: i for i, h in enumerate(headers)}
+        # Same columns as last time (another page, or a reload): the headings are already set up
+        if self._headers != self._tree_headers:
+            self.data_tree["columns"] = headers
+            for header in headers:
+                self.data_tree.heading(header, text=header)
+                self.data_tree.column(header, width=100, stretch=tk.YES)
+            self._tree_headers = self._headers
+
+        # Row iids are their positions in the table, so a reloaded row keeps the iid it had before
+        self._insert_row_chunk(enumerate(rows, offset), on_rows_loaded)
+        self.data_tree.configure(displaycolumns="#all")
         
+    def _insert_row_chunk(self, numbered_rows, on_rows_loaded):
+        """Inserts the next chunk of rows, scheduling the rest at idle so the window stays responsive."""
+        self._row_load_job = None
+        insert = self.data_tree.insert
+        count = 0
+        for i, row in itertools.islice(numbered_rows, ROW_INSERT_CHUNK):
+            insert("", "end", iid=str(i), values=row)
+            count += 1
+        if count == ROW_INSERT_CHUNK:
+            self._row_load_job = self.after_idle(self._insert_row_chunk, numbered_rows, on_rows_loaded)
+        elif on_rows_loaded:
+            on_rows_loaded()
+
     def on_structure_select(self, event=None):
         """Enables/disables the remove column button based on selection."""
         state = "normal" if self.details_tree.selection() else "disabled"
         self.remove_column_btn.config(state=state)
 
     def create_table(self):
-        dialog = CreateTableDialog(self, self.db_name)
+        if self._write_in_flight: return
+        dialog = CreateTableDialog(self, self.db_name, table_names=self._get_table_names())
         if dialog.result:
             table_name, columns = dialog.result
-            success, message = dbm.create_table(self.db_name, table_name, columns)
-            if success:
-                messagebox.showinfo("Success", message, parent=self)
-                self.refresh_table_list()
-            else:
-                messagebox.showerror("Error", message, parent=self)
+            self._submit(dbm.create_table, self.db_name, table_name, columns,
+                         on_done=self._on_create_table_done, write=True)
+
+    def _on_create_table_done(self, result):
+        """Shared by create_table and delete_table: both change the table list."""
+        success, message = result
+        if success:
+            self._invalidate_schema()
+            messagebox.showinfo("Success", message, parent=self)
+            self.refresh_table_list()
+        else:
+            messagebox.showerror("Error", message, parent=self)
 
     def add_column_to_table(self):
-        selection = self.table_list.curselection()
-        if not selection: return
-        table_name = self.table_list.get(selection[0])
+        if self._write_in_flight: return
+        table_name = self._active_table
+        if table_name is None: return
 
-        existing_cols_info = dbm.get_table_columns(self.db_name, table_name)
+        existing_cols_info = self._get_schema(table_name)['columns']
         
         # Open the dialog in "add mode"
-        dialog = ColumnDialog(self, self.db_name, all_column_names=existing_cols_info, add_mode=True)
+        dialog = ColumnDialog(self, self.db_name, all_column_names=existing_cols_info, add_mode=True, table_names=self._get_table_names())
         if dialog.result:
             new_column_def = dialog.result
             
-            success, message = dbm.add_column(self.db_name, table_name, new_column_def)
-            if success:
-                messagebox.showinfo("Success", message, parent=self)
-                self.on_table_select() # Refresh view
-            else:
-                messagebox.showerror("Error", message, parent=self)
+            self._submit(dbm.add_column, self.db_name, table_name, new_column_def,
+                         on_done=lambda result: self._on_column_change_done(table_name, result), write=True)
+
+    def _on_column_change_done(self, table_name, result):
+        success, message = result
+        if success:
+            self._invalidate_schema(table_name)
+            messagebox.showinfo("Success", message, parent=self)
+            self.on_table_select() # Refresh view
+        else:
+            messagebox.showerror("Error", message, parent=self)
 
     def remove_column_from_table(self):
-        table_selection = self.table_list.curselection()
+        if self._write_in_flight: return
+        table_name = self._active_table
         col_selection = self.details_tree.selection()
-        if not table_selection or not col_selection:
+        if table_name is None or not col_selection:
             return
         
-        table_name = self.table_list.get(table_selection[0])
         item = self.details_tree.item(col_selection[0])
         column_to_remove = item['text']
         
@@ -552,66 +1093,83 @@ class TableManagerWindow(tk.Toplevel):
         )
         
         if confirm:
-            success, message = dbm.remove_column(self.db_name, table_name, column_to_remove)
-            if success:
-                messagebox.showinfo("Success", message, parent=self)
-                self.on_table_select()
-            else:
-                messagebox.showerror("Error", message, parent=self)
+            self._submit(dbm.remove_column, self.db_name, table_name, column_to_remove,
+                         on_done=lambda result: self._on_column_change_done(table_name, result), write=True)
 
     def add_row(self):
-        selection = self.table_list.curselection()
-        if not selection: return
-        table_name = self.table_list.get(selection[0])
+        if self._write_in_flight: return
+        table_name = self._active_table
+        if table_name is None: return
         
-        dialog = RowDataDialog(self, self.db_name, table_name)
+        dialog = RowDataDialog(self, self.db_name, table_name, schema=self._get_schema(table_name))
         if dialog.result:
-            success, message = dbm.insert_row(self.db_name, table_name, dialog.result)
-            if success:
-                # Refresh the data view to show the new row
-                self.on_table_select()
-                # Go to the last row
-                last_item = self.data_tree.get_children()[-1]
-                self.data_tree.selection_set(last_item)
-                self.data_tree.focus(last_item)
-                self.data_tree.see(last_item)
-            else:
-                messagebox.showerror("Error", message, parent=self)
+            self._submit(dbm.insert_row, self.db_name, table_name, dialog.result,
+                         on_done=self._on_row_added, write=True)
+
+    def _on_row_added(self, result):
+        success, message = result
+        if success:
+            # Refresh the data view to show the new row, then go to the last row once it's loaded
+            self.on_table_select(on_rows_loaded=self._select_last_row, page=-1)
+        else:
+            messagebox.showerror("Error", message, parent=self)
+
+    def _pk_values(self, row_values, pk_names):
+        """Picks a row's primary key values out by their cached column positions."""
+        index = self._header_index
+        return {pk: row_values[index[pk]] for pk in pk_names}
 
     def edit_row(self, event=None):
         """Handles double-click on a row to edit it."""
+        if self._write_in_flight: return
         selection = self.data_tree.selection()
         if not selection: return
         item_id = selection[0]
         
-        table_name = self.table_list.get(self.table_list.curselection()[0])
-        headers = self.data_tree['columns']
+        table_name = self._active_table
         row_values = self.data_tree.item(item_id, 'values')
-        initial_data = dict(zip(headers, row_values))
+        initial_data = dict(zip(self._headers, row_values))
 
-        pk_names = dbm.get_primary_key_columns(self.db_name, table_name)
-        pk_dict = {pk: initial_data[pk] for pk in pk_names}
+        schema = self._get_schema(table_name)
+        pk_names = schema['pk_names']
+        pk_dict = self._pk_values(row_values, pk_names)
 
-        dialog = RowDataDialog(self, self.db_name, table_name, initial_data=initial_data)
+        dialog = RowDataDialog(self, self.db_name, table_name, initial_data=initial_data, schema=schema)
         if dialog.result:
             # Don't include PKs in the data to be updated
             update_data = {k: v for k, v in dialog.result.items() if k not in pk_names}
-            success, message = dbm.update_row(self.db_name, table_name, pk_dict, update_data)
-            if success:
-                self.on_table_select()
-                # Re-select the edited row
-                self.data_tree.selection_set(item_id)
-                self.data_tree.focus(item_id)
-            else:
-                messagebox.showerror("Update Failed", message, parent=self)
+            self._submit(dbm.update_row, self.db_name, table_name, pk_dict, update_data,
+                         on_done=lambda result: self._on_row_updated(item_id, result), write=True)
+
+    def _on_row_updated(self, item_id, result):
+        success, message = result
+        if success:
+            # Re-select the edited row once the refreshed data is in
+            self.on_table_select(on_rows_loaded=lambda: self._reselect_row(item_id))
+        else:
+            messagebox.showerror("Update Failed", message, parent=self)
+
+    def _select_last_row(self):
+        children = self.data_tree.get_children()
+        if children:
+            last_item = children[-1]
+            self.data_tree.selection_set(last_item)
+            self.data_tree.focus(last_item)
+            self.data_tree.see(last_item)
+
+    def _reselect_row(self, item_id):
+        if self.data_tree.exists(item_id):
+            self.data_tree.selection_set(item_id)
+            self.data_tree.focus(item_id)
 
     def delete_row(self):
         """Deletes the selected row from the data view."""
+        if self._write_in_flight: return
         selection = self.data_tree.selection()
         if not selection: return
 
-        table_name = self.table_list.get(self.table_list.curselection()[0])
-        pk_names = dbm.get_primary_key_columns(self.db_name, table_name)
+        table_name = self._active_table
+        pk_names = self._get_schema(table_name)['pk_names']
         if not pk_names:
             messagebox.showerror("Error", f"Cannot delete row: Table '{table_name}' has no primary key.", parent=self)
             return
@@ -619,63 +1177,91 @@ class TableManagerWindow(tk.Toplevel):
         confirm = messagebox.askyesno("Confirm Deletion", "Are you sure you want to delete the selected row?", parent=self)
         if not confirm: return
 
-        headers = self.data_tree['columns']
         row_values = self.data_tree.item(selection[0], 'values')
-        pk_dict = {pk: row_values[headers.index(pk)] for pk in pk_names}
+        pk_dict = self._pk_values(row_values, pk_names)
+
+        self._submit(dbm.delete_row, self.db_name, table_name, pk_dict,
+                     on_done=self._on_row_deleted, write=True)
 
-        success, message = dbm.delete_row(self.db_name, table_name, pk_dict)
+    def _on_row_deleted(self, result):
+        success, message = result
         if success:
             self.on_table_select()
         else:
             messagebox.showerror("Deletion Failed", message, parent=self)
 
     def delete_table(self):
-        selection = self.table_list.curselection()
-        if not selection:
+        """Deletes every selected table; the views only ever show the first of them."""
+        if self._write_in_flight: return
+        if self._active_table is None:
             return
+        table_names = [self.table_list.get(i) for i in self.table_list.curselection()] or [self._active_table]
 
-        table_name = self.table_list.get(selection[0])
-
+        if len(table_names) == 1:
+            prompt = f"Are you sure you want to permanently delete the table '{table_names[0]}'?"
+        else:
+            prompt = f"Are you sure you want to permanently delete these {len(table_names)} tables?\n\n" + ", ".join(table_names)
         confirm = messagebox.askyesno(
             "Confirm Deletion",
-            f"Are you sure you want to permanently delete the table '{table_name}'?\n\nThis action cannot be undone.",
+            prompt + "\n\nThis action cannot be undone.",
             parent=self
         )
 
         if confirm:
-            success, message = dbm.delete_table(self.db_name, table_name)
-            if success:
-                messagebox.showinfo("Success", message, parent=self)
-                self.refresh_table_list()
-            else:
-                messagebox.showerror("Error", message, parent=self)
+            self._submit(dbm.delete_tables, self.db_name, table_names,
+                         on_done=self._on_create_table_done, write=True)
 
     def export_to_csv(self):
         """Handles exporting the current table's data to a CSV file."""
-        selection = self.table_list.curselection()
-        if not selection:
+        table_name = self._active_table
+        if table_name is None or self._export_in_flight:
             return
         
-        table_name = self.table_list.get(selection[0])
-        
-        default_export_dir = dbm.get_default_export_dir()
-        filepath = filedialog.asksaveasfilename(
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-            title=f"Export '{table_name}' to CSV",
-            initialdir=default_export_dir,
-            initialfile=f"{table_name}_export.csv"
-        )
+        filepath = filedialog.asksaveasfilename(**_export_dialog_options(table_name))
         
         if not filepath:
             return # User cancelled the dialog
             
-        try:
-            headers, rows = dbm.get_table_data(self.db_name, table_name)
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-                writer.writerows(rows)
-            messagebox.showinfo("Success", f"Data from '{table_name}' successfully exported to:\n{filepath}", parent=self)
-        except (IOError, Exception) as e:
-            messagebox.showerror("Export Failed", f"An error occurred while exporting the file:\n{e}", parent=self)
\ No newline at end of file
+        # The export runs on the worker so the window keeps repainting; the buttons stay off until it's done
+        self._start_export()
+        self._submit(_export_table_csv, self.db_name, table_name, filepath,
+                     on_done=self._on_export_done, on_error=self._end_export)
+
+    def copy_to_clipboard(self):
+        """Copies the current table's data to the clipboard as CSV, without going through a file."""
+        table_name = self._active_table
+        if table_name is None or self._export_in_flight:
+            return
+        self._start_export()
+        self._submit(_table_csv_for_clipboard, self.db_name, table_name,
+                     on_done=lambda result: self._on_clipboard_ready(table_name, result), on_error=self._end_export)
+
+    def _on_clipboard_ready(self, table_name, result):
+        self._end_export()
+        failure, text = result
+        if failure is None:
+            self.clipboard_clear()
+            self.clipboard_append(text)
+            messagebox.showinfo("Success", f"Data from '{table_name}' copied to the clipboard.", parent=self)
+        else:
+            title = "Query Failed" if failure == READ_FAILED else "Copy Failed"
+            messagebox.showerror(title, text, parent=self)
+
+    def _start_export(self):
+        self._export_in_flight = True
+        self.export_csv_btn.config(state="disabled")
+        self.copy_csv_btn.config(state="disabled")
+
+    def _end_export(self):
+        self._export_in_flight = False
+        self.export_csv_btn.config(state=self._selection_buttons_state)
+        self.copy_csv_btn.config(state=self._selection_buttons_state)
+
+    def _on_export_done(self, result):
+        self._end_export()
+        failure, message = result
+        if failure is None:
+            messagebox.showinfo("Success", message, parent=self)
+        else:
+            title = "Query Failed" if failure == READ_FAILED else "Export Failed"
+            messagebox.showerror(title, message, parent=self)
\ No newline at end of file